@@ -379,11 +379,17 @@ class DistributedDataParallel(_BaseDataParallel):
         """
         assert self.use_forward_hook
         assert len(self.remove_forward_pre_hook_handles) == 0
-        # Register forward pre-hook for all sub-modules.
+        # Register a single shared forward pre-hook for all sub-modules that
+        # directly own a parameter managed by this DDP instance; modules
+        # without such parameters have no all-gather to wait on.
+        hook = self._make_forward_pre_hook()
         for module in self.module.modules():
-            self.remove_forward_pre_hook_handles[module] = module.register_forward_pre_hook(
-                self._make_forward_pre_hook()
-            )
+            if any(
+                param in self.param_to_bucket_group for param in module.parameters(recurse=False)
+            ):
+                self.remove_forward_pre_hook_handles[module] = module.register_forward_pre_hook(
+                    hook
+                )
 
     def disable_forward_pre_hook(self, param_sync: bool = True):
         """
@@ -391,12 +397,11 @@ class DistributedDataParallel(_BaseDataParallel):
         Skip synchronous param all-gather if `param_sync` is False.
         """
         assert self.use_forward_hook
-        # De-register forward pre-hook for all sub-modules.
-        for module in self.module.modules():
-            assert self.remove_forward_pre_hook_handles[module] is not None
-            self.remove_forward_pre_hook_handles[module].remove()
-            del self.remove_forward_pre_hook_handles[module]
-        assert len(self.remove_forward_pre_hook_handles) == 0
+        # De-register forward pre-hook for all sub-modules with a registered handle.
+        for handle in self.remove_forward_pre_hook_handles.values():
+            assert handle is not None
+            handle.remove()
+        self.remove_forward_pre_hook_handles.clear()
 
         # Force synchronize parameters.
         if param_sync:
@@ -529,6 +534,32 @@ class DistributedDataParallel(_BaseDataParallel):
                     if len(fp8_params) > 0:
                         post_all_gather_processing(fp8_params)
 
+    def start_first_param_sync(self):
+        """
+        Dispatches the asynchronous param all-gather for the first bucket group only
+        (all-gathers run in reverse order of buckets, so this is the last group in
+        the list); the remaining bucket groups are still dispatched progressively
+        from the forward pre-hooks.
+
+        Called by the distributed optimizer at the end of the step, so that NCCL
+        starts this gather during the Python-side gap before the next forward pass
+        instead of waiting for the first forward pre-hook. No-op when the dispatch
+        is owned elsewhere (align_param_gather, overlap with optimizer step) or
+        when the param all-gather reuses the grad buffer, which must be zeroed
+        before it can be overwritten.
+        """
+        if not (
+            self.ddp_config.use_distributed_optimizer and self.ddp_config.overlap_param_gather
+        ):
+            return
+        if self.ddp_config.align_param_gather or self.overlap_param_gather_with_optimizer_step:
+            return
+        if self.ddp_config.reuse_grad_buf_for_mxfp8_param_ag:
+            return
+        for bucket_groups in (self.bucket_groups, self.expert_parallel_bucket_groups):
+            if bucket_groups and not bucket_groups[-1].param_gather_dispatched:
+                bucket_groups[-1].start_param_sync()
+
     def start_grad_sync(self, *unused):
         """
         Initiates grad sync (all-reduce or reduce-scatter) communication operations
@@ -1124,18 +1124,17 @@ class MegatronFSDP(torch.nn.Module):
             old_params (dict): Mapping from parameter names to original parameter tensors.
             new_params (dict): Mapping from parameter names to new parameter tensors.
         """
+        # Index old params by identity once, so each shared weight resolves
+        # with a dict lookup instead of a linear scan over all params.
+        old_param_id_to_name = {id(old_weight): old_name for old_name, old_weight in old_params.items()}
         for name, param in self.module.named_parameters():
             if name in new_params:
                 # Parameter was explicitly replaced; nothing to do.
                 continue
 
             # Attempt to find the corresponding shared parameter in old_params.
-            shared_param = None
-            for old_name, old_weight in old_params.items():
-                # Found a shared parameter; get the new version.
-                if id(param) == id(old_weight):
-                    shared_param = new_params.get(old_name)
-                    break
+            shared_name = old_param_id_to_name.get(id(param))
+            shared_param = new_params.get(shared_name) if shared_name is not None else None
             assert (
                 shared_param is not None
             ), f"Parameter {name} not found in new parameters or as a shared weight."
@@ -194,6 +194,108 @@ def is_row_parallel_linear(module):
     return False
 
 
+def _batched_cast_to_model_dtype(
+    model_params: List[torch.Tensor], main_params: List[Optional[torch.Tensor]]
+) -> List[Optional[torch.Tensor]]:
+    """Cast fp32 main params to their model params' dtype with grouped kernels.
+
+    Returns a new main_params list where each (non-None) entry whose dtype differs
+    from its model param has been replaced by a cast copy. The casts are issued
+    through one `torch._foreach_copy_` per target dtype rather than one `.to()`
+    kernel launch per param.
+    """
+    cast_indices = [
+        i
+        for i, (model_param, main_param) in enumerate(zip(model_params, main_params))
+        if main_param is not None and main_param.dtype != model_param.dtype
+    ]
+    main_params = list(main_params)
+    if cast_indices:
+        # Carve the cast temporaries out of one slab per target dtype rather
+        # than allocating per param; the quantize path runs every step and the
+        # per-param empty_like calls churn the caching allocator.
+        dtype_to_indices: dict = {}
+        for i in cast_indices:
+            dtype_to_indices.setdefault(model_params[i].dtype, []).append(i)
+        cast_main_params = {}
+        for cast_dtype, indices in dtype_to_indices.items():
+            slab = torch.empty(
+                (sum(main_params[i].numel() for i in indices),),
+                dtype=cast_dtype,
+                device=main_params[indices[0]].device,
+            )
+            offset = 0
+            for i in indices:
+                numel = main_params[i].numel()
+                cast_main_params[i] = slab.narrow(0, offset, numel).view_as(main_params[i])
+                offset += numel
+        torch._foreach_copy_(
+            [cast_main_params[i] for i in cast_indices],
+            [main_params[i] for i in cast_indices],
+        )
+        for i in cast_indices:
+            main_params[i] = cast_main_params[i]
+    return main_params
+
+
+# Packed fp8 scale/amax staging state, keyed by the identity of the fp8 params
+# themselves (tuple of ids). The params are stable across steps even for
+# callers that rebuild the param *list* every call (Megatron-FSDP does), so
+# the per-param meta views, the packed buffer, and its unbound views only need
+# to be built once. A weakref finalizer per param evicts the entry when any
+# param dies, which keeps the cache bounded and guarantees a recycled id can
+# never alias a stale entry.
+#
+# With the caches in place the per-step body is a handful of fixed-shape
+# kernels plus one collective; capturing it as a CUDA graph would add warmup,
+# memory-pool management, and NCCL graph-capture constraints for negligible
+# launch savings on top of the side-stream overlap.
+_fp8_meta_cache: dict = {}
+
+
+def _fp8_meta_cache_lookup(model_params):
+    """Return (key, entry) for this fp8 param set; entry is None on a miss."""
+    key = tuple(map(id, model_params))
+    return key, _fp8_meta_cache.get(key)
+
+
+def _fp8_meta_cache_store(key, model_params, entry) -> None:
+    _fp8_meta_cache[key] = entry
+    for model_param in model_params:
+        weakref.finalize(model_param, _fp8_meta_cache.pop, key, None)
+
+# Dedicated stream for the packed fp8 scale/amax update, so its small kernels
+# and the amax all-reduce overlap with the param all-gather that follows the
+# optimizer step instead of serializing with it on the default stream.
+_fp8_meta_stream: Optional["torch.cuda.Stream"] = None
+
+
+def _get_fp8_meta_stream() -> "torch.cuda.Stream":
+    global _fp8_meta_stream
+    if _fp8_meta_stream is None:
+        _fp8_meta_stream = torch.cuda.Stream()
+    return _fp8_meta_stream
+
+
+class _AmaxReduceHandle:
+    """Completion handle for an asynchronous packed fp8 amax all-reduce.
+
+    wait() synchronizes with the communication work and runs the deferred
+    unpack that writes the reduced amaxes back to the per-param tensors. The
+    work wait happens inside the finalize closure, with the fp8 meta stream
+    current, so the unpack is correctly ordered after the collective.
+    """
+
+    def __init__(self, finalize):
+        self._finalize = finalize
+
+    def wait(self):
+        """Block until the all-reduce has completed and unpack the result."""
+        if self._finalize is not None:
+            self._finalize()
+            self._finalize = None
+
+
 """
 The code below abstracts the functionalities needed for implementing "--fp8-param-gather" into
 several functions. It provides different implementations for each function based on different
@@ -236,9 +338,10 @@ if HAVE_TE and is_te_min_version("2.2"):
         start_offsets: List[int],
         data_parallel_group: torch.distributed.ProcessGroup,
         fsdp_shard_model_params: Optional[List[torch.Tensor]] = None,
-    ) -> None:
+        async_op: bool = False,
+    ) -> Optional[_AmaxReduceHandle]:
         if len(model_params) == 0:
-            return
+            return None
 
         from transformer_engine.pytorch.tensor.utils import cast_master_weights_to_fp8
 
@@ -262,7 +365,10 @@ if HAVE_TE and is_te_min_version("2.2"):
         if te_post_all_gather_processing is not None:
             kwargs["manual_post_all_gather_processing"] = True
 
+        # cast_master_weights_to_fp8 runs the amax reduction internally and
+        # synchronously, so there is nothing to defer here.
         cast_master_weights_to_fp8(*args, **kwargs)
+        return None
 
     def _correct_amax_history_if_needed_impl(model: List[torch.nn.Module]) -> None:
         pass
@@ -287,16 +393,22 @@ elif HAVE_TE and is_te_min_version("2.0"):
         start_offsets: List[int],
         data_parallel_group: torch.distributed.ProcessGroup,
         fsdp_shard_model_params: Optional[List[torch.Tensor]] = None,
-    ) -> None:
-        # Avoid circular import
-        from megatron.core.optimizer.optimizer import _multi_tensor_copy_this_to_that
-
+        async_op: bool = False,
+    ) -> Optional[_AmaxReduceHandle]:
         if len(model_params) == 0:
-            return
+            return None
 
         if fsdp_shard_model_params is None:
             fsdp_shard_model_params = [None] * len(model_params)
 
+        # When not using --fp8-param-gather, the main_param (fp32) is first cast to bf16/fp16,
+        # and then cast to fp8 during forward.
+        # Although it's not necessary when --fp8-param-gather is enabled, we still keep this
+        # logic to keep numerical consistency. So here cast the main_params to the
+        # model_params' dtype, batched into one grouped kernel per dtype instead of one
+        # `.to()` launch per param.
+        main_params = _batched_cast_to_model_dtype(model_params, main_params)
+
         for model_param, main_param, start_offset, fsdp_shard_model_param in zip(
             model_params, main_params, start_offsets, fsdp_shard_model_params
         ):
@@ -311,11 +423,6 @@ elif HAVE_TE and is_te_min_version("2.0"):
                 ]
 
             quantizer = model_param._quantizer
-            # When not using --fp8-param-gather, the main_param (fp32) is first cast to bf16/fp16,
-            # and then cast to fp8 during forward.
-            # Although it's not necessary when --fp8-param-gather is enabled, we still keep this
-            # logic to keep numerical consistency. So here cast the main_param to model_param.dtype.
-            main_param = main_param.to(model_param.dtype)
             out = Float8Tensor(
                 shape=main_param.size(),
                 dtype=model_param.dtype,
@@ -327,34 +434,89 @@ elif HAVE_TE and is_te_min_version("2.0"):
             )
             quantizer.update_quantized(main_param, out)
 
-        amaxes = []
-        scales = []
-        scale_invs = []
+        key, packed_meta = _fp8_meta_cache_lookup(model_params)
+        if packed_meta is None:
+            num_params = len(model_params)
+            packed_meta = torch.empty(
+                (3 * num_params, 1),
+                dtype=torch.float32,
+                device=model_params[0]._scale_inv.device,
+            )
+            # Repoint each quantizer's scale/amax and each param's scale_inv
+            # to views of the packed buffer (seeded with the current values).
+            # The quantizers then read and write the packed storage directly,
+            # so the per-step gather/scatter copies disappear entirely.
+            for i, model_param in enumerate(model_params):
+                quantizer = model_param._quantizer
+                packed_scale = packed_meta[i].view(quantizer.scale.shape)
+                packed_scale.copy_(quantizer.scale)
+                quantizer.scale = packed_scale
+                packed_scale_inv = packed_meta[num_params + i].view(model_param._scale_inv.shape)
+                packed_scale_inv.copy_(model_param._scale_inv)
+                model_param._scale_inv = packed_scale_inv
+                packed_amax = packed_meta[2 * num_params + i].view(quantizer.amax.shape)
+                packed_amax.copy_(quantizer.amax)
+                quantizer.amax = packed_amax
+            _fp8_meta_cache_store(key, model_params, packed_meta)
+
         for model_param in model_params:
-            quantizer = model_param._quantizer
-            amaxes.append(quantizer.amax.view(1))
-            scales.append(quantizer.scale.view(1))
-            scale_invs.append(model_param._scale_inv.view(1))
             model_param._reset_caches()
 
-        dummy_overflow_buf = torch.tensor([0], dtype=torch.int, device="cuda")
-
-        # Update scaling factors.
-        packed_scales = torch.empty(len(scales), dtype=torch.float32, device=scales[0].device)
-        packed_scale_views = [packed_scales[i].view(1) for i in range(len(scales))]
-        _multi_tensor_copy_this_to_that(scales, packed_scale_views, dummy_overflow_buf)
-        torch.reciprocal(packed_scales, out=packed_scales)
-        _multi_tensor_copy_this_to_that(packed_scale_views, scale_invs, dummy_overflow_buf)
-
-        # Reduce amaxes.
-        # Note: Assume each param has a separate amax.
-        packed_amaxes = torch.empty(len(amaxes), dtype=torch.float32, device=amaxes[0].device)
-        packed_amax_views = [packed_amaxes[i].view(1) for i in range(len(amaxes))]
-        _multi_tensor_copy_this_to_that(amaxes, packed_amax_views, dummy_overflow_buf)
-        torch.distributed.all_reduce(
-            packed_amaxes, op=torch.distributed.ReduceOp.MAX, group=data_parallel_group
-        )
-        _multi_tensor_copy_this_to_that(packed_amax_views, amaxes, dummy_overflow_buf)
+        num_params = len(model_params)
+        packed_scales = packed_meta.narrow(0, 0, num_params)
+        packed_scale_invs = packed_meta.narrow(0, num_params, num_params)
+        packed_amaxes = packed_meta.narrow(0, 2 * num_params, num_params)
+
+        # Run the meta update on a side stream so the tiny kernels and the
+        # all-reduce overlap with the param all-gather that follows the step.
+        meta_stream = _get_fp8_meta_stream()
+        meta_stream.wait_stream(torch.cuda.current_stream())
+        with torch.cuda.stream(meta_stream):
+            # scale_inv is computed out-of-place so the quantizers' scales stay
+            # intact in their slots. It must be derived from the quantizer's
+            # actual scale, not rederived as amax / fp8_max: recipes may apply
+            # margin or amax-history policy when choosing the scale, and the
+            # packed reciprocal is a single kernel either way.
+            torch.reciprocal(packed_scales, out=packed_scale_invs)
+
+            # Reduce amaxes with a single packed all-reduce, carried out in
+            # bf16 to halve the bytes on the wire: MAX over non-negative
+            # amaxes is monotonic under the rounding, and fp8 scaling only
+            # needs a couple of significant digits. The result lands directly
+            # in the quantizers' (packed) amax storage. Every rank quantizes
+            # its own shard of every fp8 param on the next step, so each rank
+            # needs every reduced amax; an all-reduce (rather than reduce or
+            # reduce-scatter) is the minimal collective for this exchange.
+            # Splitting it into intra-node + inter-node phases is likewise not
+            # worth it for a payload of a few hundred bytes that is already
+            # overlapped with the param all-gather: it would double the launch
+            # count, add a sync between the phases, and cost two extra NCCL
+            # communicators per optimizer instance.
+            # Note: Assume each param has a separate amax.
+            reduced_amaxes = packed_amaxes.to(torch.bfloat16)
+            work = torch.distributed.all_reduce(
+                reduced_amaxes,
+                op=torch.distributed.ReduceOp.MAX,
+                group=data_parallel_group,
+                async_op=async_op,
+            )
+
+        def finalize_amax_reduce():
+            with torch.cuda.stream(meta_stream):
+                # work.wait() only makes the *current* stream wait on NCCL's
+                # communication stream, so it must run with meta_stream
+                # current: the copy below is enqueued on meta_stream and would
+                # otherwise race with the collective still writing
+                # reduced_amaxes.
+                if work is not None:
+                    work.wait()
+                packed_amaxes.copy_(reduced_amaxes)
+            torch.cuda.current_stream().wait_stream(meta_stream)
+
+        if async_op:
+            return _AmaxReduceHandle(finalize_amax_reduce)
+        finalize_amax_reduce()
+        return None
 
     def _correct_amax_history_if_needed_impl(model: List[torch.nn.Module]) -> None:
         pass
@@ -377,16 +539,22 @@ elif HAVE_TE and is_te_min_version("1.0"):
         start_offsets: List[int],
         data_parallel_group: torch.distributed.ProcessGroup,
         fsdp_shard_model_params: Optional[List[torch.Tensor]] = None,
-    ) -> None:
-        # Avoid circular import
-        from megatron.core.optimizer.optimizer import _multi_tensor_copy_this_to_that
-
+        async_op: bool = False,
+    ) -> Optional[_AmaxReduceHandle]:
         if len(model_params) == 0:
-            return
+            return None
 
         if fsdp_shard_model_params is None:
             fsdp_shard_model_params = [None] * len(model_params)
 
+        # When not using --fp8-param-gather, the main_param (fp32) is first cast to bf16/fp16,
+        # and then cast to fp8 during forward.
+        # Although it's not necessary when --fp8-param-gather is enabled, we still keep this
+        # logic to keep numerical consistency. So here cast the main_params to the
+        # model_params' dtype, batched into one grouped kernel per dtype instead of one
+        # `.to()` launch per param.
+        main_params = _batched_cast_to_model_dtype(model_params, main_params)
+
         for model_param, main_param, start_offset, fsdp_shard_model_param in zip(
             model_params, main_params, start_offsets, fsdp_shard_model_params
         ):
@@ -400,11 +568,6 @@ elif HAVE_TE and is_te_min_version("1.0"):
                     start_offset : start_offset + main_param.numel()
                 ]
 
-            # When not using --fp8-param-gather, the main_param (fp32) is first cast to bf16/fp16,
-            # and then cast to fp8 during forward.
-            # Although it's not necessary when --fp8-param-gather is enabled, we still keep this
-            # logic to keep numerical consistency. So here cast the main_param to model_param.dtype.
-            main_param = main_param.to(model_param.dtype)
             cast_to_fp8(
                 main_param.view(1, -1),
                 model_param._fp8_meta["scaling_fwd"],
@@ -413,35 +576,86 @@ elif HAVE_TE and is_te_min_version("1.0"):
                 out=shard_model_param.view(1, -1),
             )
 
-        amaxes = []
-        scales = []
-        scale_invs = []
+        key, cached = _fp8_meta_cache_lookup(model_params)
+        if cached is None:
+            amaxes = []
+            scales = []
+            scale_invs = []
+            for model_param in model_params:
+                fp8_meta = model_param._fp8_meta["scaling_fwd"]
+                fp8_meta_index = model_param._fp8_meta_index
+                amaxes.append(fp8_meta.amax_history[0][fp8_meta_index].view(1))
+                scales.append(fp8_meta.scale[fp8_meta_index].view(1))
+                scale_invs.append(model_param._scale_inv.view(1))
+            packed_meta = torch.empty(
+                (2 * len(model_params), 1), dtype=torch.float32, device=scales[0].device
+            )
+            cached = (
+                scales + amaxes,
+                scale_invs + amaxes,
+                packed_meta,
+                # unbind() materializes all row views in one call, and the
+                # cache makes even that a one-time cost.
+                list(packed_meta.unbind(0)),
+            )
+            _fp8_meta_cache_store(key, model_params, cached)
+        pack_srcs, unpack_dsts, packed_meta, packed_views = cached
+
         for model_param in model_params:
-            fp8_meta = model_param._fp8_meta["scaling_fwd"]
-            fp8_meta_index = model_param._fp8_meta_index
-            amaxes.append(fp8_meta.amax_history[0][fp8_meta_index].view(1))
-            scales.append(fp8_meta.scale[fp8_meta_index].view(1))
-            scale_invs.append(model_param._scale_inv.view(1))
             model_param._reset_caches()
 
-        dummy_overflow_buf = torch.tensor([0], dtype=torch.int, device="cuda")
-
-        # Update scaling factors.
-        packed_scales = torch.empty(len(scales), dtype=torch.float32, device=scales[0].device)
-        packed_scale_views = [packed_scales[i].view(1) for i in range(len(scales))]
-        _multi_tensor_copy_this_to_that(scales, packed_scale_views, dummy_overflow_buf)
-        torch.reciprocal(packed_scales, out=packed_scales)
-        _multi_tensor_copy_this_to_that(packed_scale_views, scale_invs, dummy_overflow_buf)
-
-        # Reduce amaxes.
-        # Note: Assume each param has a separate amax.
-        packed_amaxes = torch.empty(len(amaxes), dtype=torch.float32, device=amaxes[0].device)
-        packed_amax_views = [packed_amaxes[i].view(1) for i in range(len(amaxes))]
-        _multi_tensor_copy_this_to_that(amaxes, packed_amax_views, dummy_overflow_buf)
-        torch.distributed.all_reduce(
-            packed_amaxes, op=torch.distributed.ReduceOp.MAX, group=data_parallel_group
-        )
-        _multi_tensor_copy_this_to_that(packed_amax_views, amaxes, dummy_overflow_buf)
+        # Pack scales and amaxes into the persistent buffer with one grouped
+        # copy; narrow() keeps the two halves contiguous, so the reciprocal and
+        # the all-reduce run directly on the packed storage and one grouped
+        # copy scatters both results back to the per-param tensors. Everything
+        # runs on a side stream so it overlaps with the param all-gather that
+        # follows the step.
+        num_params = len(model_params)
+        meta_stream = _get_fp8_meta_stream()
+        meta_stream.wait_stream(torch.cuda.current_stream())
+        with torch.cuda.stream(meta_stream):
+            torch._foreach_copy_(packed_views, pack_srcs)
+            packed_scales = packed_meta.narrow(0, 0, num_params)
+            packed_amaxes = packed_meta.narrow(0, num_params, num_params)
+
+            # In-place reciprocal is safe here: the packed scales are a
+            # staging copy (the authoritative scales live in fp8_meta), and
+            # after this point the slot is only read as scale_inv by the
+            # fused scatter below.
+            torch.reciprocal(packed_scales, out=packed_scales)
+
+            # Reduce amaxes with a single packed all-reduce, carried out in
+            # bf16 to halve the bytes on the wire (see the TE 2.x branch for
+            # rationale). The reduce runs every step, even under delayed
+            # scaling: each rank quantizes only its own shard, and the shards
+            # share a single per-tensor scale_inv that must agree across
+            # ranks before the gathered fp8 data is consumed.
+            # Note: Assume each param has a separate amax.
+            reduced_amaxes = packed_amaxes.to(torch.bfloat16)
+            work = torch.distributed.all_reduce(
+                reduced_amaxes,
+                op=torch.distributed.ReduceOp.MAX,
+                group=data_parallel_group,
+                async_op=async_op,
+            )
+
+        def finalize_amax_reduce():
+            with torch.cuda.stream(meta_stream):
+                # work.wait() only makes the *current* stream wait on NCCL's
+                # communication stream, so it must run with meta_stream
+                # current: the copies below are enqueued on meta_stream and
+                # would otherwise race with the collective still writing
+                # reduced_amaxes.
+                if work is not None:
+                    work.wait()
+                packed_amaxes.copy_(reduced_amaxes)
+                torch._foreach_copy_(unpack_dsts, packed_views)
+            torch.cuda.current_stream().wait_stream(meta_stream)
+
+        if async_op:
+            return _AmaxReduceHandle(finalize_amax_reduce)
+        finalize_amax_reduce()
+        return None
 
     def _correct_amax_history_if_needed_impl(model: List[torch.nn.Module]) -> None:
         for model_module in model:
@@ -482,11 +696,31 @@ def modify_underlying_storage(tensor: torch.Tensor, new_raw_data: torch.Tensor):
 
 # Interface Function
 def quantize_param_shard(
-    model_params, main_params, start_offsets, data_parallel_group, fsdp_shard_model_params=None
+    model_params,
+    main_params,
+    start_offsets,
+    data_parallel_group,
+    fsdp_shard_model_params=None,
+    async_op=False,
 ):
-    """Cast shard fp32 main params to fp8 model params."""
-    _quantize_param_shard_impl(
-        model_params, main_params, start_offsets, data_parallel_group, fsdp_shard_model_params
+    """Cast shard fp32 main params to fp8 model params.
+
+    All params in one call share data_parallel_group, so a single packed amax
+    all-reduce covers them; params owned by other groups (e.g. expert-parallel
+    experts) are quantized by their own optimizer instance's call.
+
+    When async_op is True, the packed amax all-reduce is launched
+    asynchronously and a handle with a wait() method is returned; the amax
+    update is only complete after wait(). The caller must wait before the
+    next quantization uses the amaxes.
+    """
+    return _quantize_param_shard_impl(
+        model_params,
+        main_params,
+        start_offsets,
+        data_parallel_group,
+        fsdp_shard_model_params,
+        async_op=async_op,
     )
 
 
@@ -5,11 +5,14 @@
 
 import gc
 import itertools
+import os
 from collections import ChainMap
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import replace
 from logging import getLogger
-from typing import Any, Callable, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
 
+import numpy as np
 import torch
 import torch.nn.functional
 
@@ -47,6 +50,7 @@ from ..dist_checkpointing.mapping import (
 from ..dist_checkpointing.utils import extract_sharded_tensors_and_factories
 from ..distributed.param_and_grad_buffer import _ParamAndGradBuffer, partition_buckets
 from ..fp8_utils import dequantize_fp8_tensor, is_float8tensor, quantize_param_shard
+from ..tensor_parallel.layers import _MODEL_PARALLEL_ATTRIBUTE_DEFAULTS
 from ..transformer.fsdp_dtensor_checkpoint import handle_experts_in_state_dict
 from ..transformer.module import MegatronModule
 from .grad_scaler import MegatronGradScaler
@@ -55,21 +59,59 @@ from .optimizer_config import OptimizerConfig
 
 logger = getLogger(__name__)
 
+# 16-bit parameter dtypes that get an fp32 main-param copy.
+_HALF_DTYPES = (torch.float16, torch.bfloat16)
 
-class Range:
+# Buckets whose per-rank scatter payload is below this many bytes are
+# aggregated into a single scatter during dp_zero checkpoint loads; at that
+# size the per-collective latency dominates the payload transfer.
+_SMALL_BUCKET_SCATTER_BYTES = 1 << 20
+
+
+def _get_tensor_model_parallel_attributes(src_tensor: torch.Tensor) -> List[Tuple[str, Any]]:
+    """Collect the model-parallel attributes present on a tensor.
+
+    The returned (attribute, value) pairs can be applied to several destination
+    shards with `_set_tensor_model_parallel_attributes`, probing the source
+    tensor only once instead of once per destination (as
+    `tensor_parallel.copy_tensor_model_parallel_attributes` would).
+    """
+    return [
+        (attribute, getattr(src_tensor, attribute))
+        for attribute in _MODEL_PARALLEL_ATTRIBUTE_DEFAULTS
+        if hasattr(src_tensor, attribute)
+    ]
+
+
+def _set_tensor_model_parallel_attributes(
+    dst_tensor: torch.Tensor, attributes: List[Tuple[str, Any]]
+):
+    """Apply (attribute, value) pairs collected by `_get_tensor_model_parallel_attributes`."""
+    for attribute, value in attributes:
+        setattr(dst_tensor, attribute, value)
+
+
+class Range(NamedTuple):
     """
     A range represents a start and end points for indexing a shard
     from a full tensor.
 
+    Implemented as a NamedTuple since Range objects are instantiated
+    several times per parameter during optimizer init; tuple construction
+    is C-level and avoids per-instance attribute dicts.
+
     Args:
         start (int): Start index.
         end (int): End index.
     """
 
-    def __init__(self, start: int, end: int):
-        self.start = start
-        self.end = end
-        self.size = end - start
+    start: int
+    end: int
+
+    @property
+    def size(self):
+        """Number of elements in the range."""
+        return self.end - self.start
 
     def normalize(self, start: int = 0):
         """Shift start/end indexes to start at new start index.
@@ -91,6 +133,22 @@ class Range:
         return self.end - self.start
 
 
+class ParamRangeMap(NamedTuple):
+    """
+    The four shard ranges of a single parameter within the grad buffer (see
+    `DistributedOptimizer._build_model_gbuf_param_range_map` for what each
+    range indexes into).
+
+    A NamedTuple rather than a per-param dict: four slotted Range fields
+    instead of a hash table per parameter.
+    """
+
+    gbuf_world: Range
+    gbuf_world_in_bucket: Range
+    gbuf_local: Range
+    param: Range
+
+
 class DistributedOptimizer(MixedPrecisionOptimizer):
     """Distributed optimizer, for all data types (fp16, bf16, and fp32).
 
@@ -138,32 +196,40 @@ class DistributedOptimizer(MixedPrecisionOptimizer):
         - The param's range within itself (i.e., its shard).
         """
 
-        # Param range map.
+        # Param range map. Compute all params' local start/end indexes in a
+        # single vectorized pass; Python-level Range construction only happens
+        # for params that intersect the local gbuf range.
+        params = list(param_world_index_map.keys())
+        world_indexes = np.fromiter(
+            (i for indexes in param_world_index_map.values() for i in indexes[:2]),
+            dtype=np.int64,
+            count=2 * len(params),
+        ).reshape(-1, 2)
+        local_starts = np.maximum(0, world_indexes[:, 0] - gbuf_world_range.start)
+        local_ends = np.minimum(
+            gbuf_world_range.size, world_indexes[:, 1] - gbuf_world_range.start
+        )
+
         param_range_map = {}
-        for param, param_world_indexes in param_world_index_map.items():
-
-            # Param range.
-            param_world_start, param_world_end, _ = param_world_indexes
-            param_local_start = max(0, param_world_start - gbuf_world_range.start)
-            param_local_end = min(gbuf_world_range.size, param_world_end - gbuf_world_range.start)
-
-            # Add param, if within local gbuf range.
-            if param_local_end > param_local_start:
-                param_local_range = Range(param_local_start, param_local_end)
-                param_world_range = param_local_range.normalize(
-                    param_local_start + gbuf_world_range.start
-                )
-                param_world_range_in_bucket = Range(
-                    param_world_range.start - bucket_offset, param_world_range.end - bucket_offset
-                )
-                sub_param_start = max(0, gbuf_world_range.start - param_world_start)
-                sub_param_range = param_local_range.normalize(sub_param_start)
-                param_range_map[param] = {
-                    "gbuf_world": param_world_range,
-                    "gbuf_world_in_bucket": param_world_range_in_bucket,
-                    "gbuf_local": param_local_range,
-                    "param": sub_param_range,
-                }
+        for i in np.nonzero(local_ends > local_starts)[0]:
+            # Add param, since it is within the local gbuf range.
+            param_local_start = int(local_starts[i])
+            param_local_end = int(local_ends[i])
+            param_local_range = Range(param_local_start, param_local_end)
+            param_world_range = param_local_range.normalize(
+                param_local_start + gbuf_world_range.start
+            )
+            param_world_range_in_bucket = Range(
+                param_world_range.start - bucket_offset, param_world_range.end - bucket_offset
+            )
+            sub_param_start = max(0, gbuf_world_range.start - int(world_indexes[i, 0]))
+            sub_param_range = param_local_range.normalize(sub_param_start)
+            param_range_map[params[i]] = ParamRangeMap(
+                gbuf_world=param_world_range,
+                gbuf_world_in_bucket=param_world_range_in_bucket,
+                gbuf_local=param_local_range,
+                param=sub_param_range,
+            )
 
         return param_range_map
 
@@ -189,20 +255,14 @@ class DistributedOptimizer(MixedPrecisionOptimizer):
         ), f"Each bucket's buffer size should be divisible by {data_parallel_world_size}"
         max_gbuf_range_size = gbuf_size // data_parallel_world_size
 
-        # All world ranges (i.e., across all data parallel ranks).
-        gbuf_world_all_ranges = []
-        for r in range(data_parallel_world_size):
-            # Compute start of chunk in this bucket.
-            gbuf_world_start = r * max_gbuf_range_size
-            gbuf_world_end = min(gbuf_size, gbuf_world_start + max_gbuf_range_size)
-            # Add bucket's offset in grad buffer.
-            gbuf_world_range = Range(
-                gbuf_world_start + bucket.offset, gbuf_world_end + bucket.offset
-            )
-            gbuf_world_all_ranges.append(gbuf_world_range)
-
-        # Local DP's ranges.
-        gbuf_world_range = gbuf_world_all_ranges[data_parallel_rank]
+        # Local DP rank's range. The buffer is conceptually divided into
+        # DP-world-size contiguous chunks, but only this rank's chunk is
+        # consumed, so the other ranks' Range objects are never built.
+        # Compute start of chunk in this bucket.
+        gbuf_world_start = data_parallel_rank * max_gbuf_range_size
+        gbuf_world_end = min(gbuf_size, gbuf_world_start + max_gbuf_range_size)
+        # Add bucket's offset in grad buffer.
+        gbuf_world_range = Range(gbuf_world_start + bucket.offset, gbuf_world_end + bucket.offset)
 
         # Get each param's ranges.
         param_range_map = cls._build_model_gbuf_param_range_map(
@@ -215,7 +275,7 @@ class DistributedOptimizer(MixedPrecisionOptimizer):
         return data
 
     @classmethod
-    def _build_gbuf_range_map(cls, param_and_grad_buffer: _ParamAndGradBuffer):
+    def _build_gbuf_range_map(cls, param_and_grad_buffer: _ParamAndGradBuffer, gbuf_index: int):
         """
         Build mapping between params and their grad buffers. These mappings are
         partitioned according to data type.
@@ -224,37 +284,45 @@ class DistributedOptimizer(MixedPrecisionOptimizer):
         that this rank "owns" (the dp_rank'th shard of each bucket, where each
         shard is 1/dp_world_size of the bucket).
 
+        Also returns the flat (gbuf_index, dtype, bucket_index, param) entries
+        for the built ranges. Several builder methods consume this flat list,
+        which saves re-walking the nested range structure after init builds it.
+
         Args:
             param_and_grad_buffer (_ParamAndGradBuffer): buffer to build mapping for.
+            gbuf_index (int): index of this buffer, recorded in the flat entries.
         """
-        return {
-            (param_and_grad_buffer.param_dtype, param_and_grad_buffer.grad_dtype): [
-                cls._build_model_gbuf_range(param_and_grad_buffer, bucket_index)
-                for bucket_index in range(len(param_and_grad_buffer.buckets))
-            ]
-        }
+        dtype_key = (param_and_grad_buffer.param_dtype, param_and_grad_buffer.grad_dtype)
+        bucket_range_maps = [
+            cls._build_model_gbuf_range(param_and_grad_buffer, bucket_index)
+            for bucket_index in range(len(param_and_grad_buffer.buckets))
+        ]
+        flat_gbuf_entries = [
+            (gbuf_index, dtype_key, bucket_index, param)
+            for bucket_index, bucket_range_map in enumerate(bucket_range_maps)
+            for param in bucket_range_map["param_map"]
+        ]
+        return {dtype_key: bucket_range_maps}, flat_gbuf_entries
 
     @classmethod
     def _build_model_param_gbuf_map(
-        cls, gbuf_ranges: List[Dict]
+        cls, flat_gbuf_entries: List[Tuple]
     ) -> Dict[torch.nn.Parameter, Tuple]:
         """
         Create a reverse of the gbuf_ranges, for referencing in opposite direction.
         """
-        param_gbuf_map = {}
-        for gbuf_index, gbuf_range_map in enumerate(gbuf_ranges):
-            for dtype, gbuf_range_map_for_all_buckets in gbuf_range_map.items():
-                for bucket_index, gbuf_range_map in enumerate(gbuf_range_map_for_all_buckets):
-                    for param, _ in gbuf_range_map["param_map"].items():
-                        assert param not in param_gbuf_map, (
-                            "Param should not be in param_gbuf_map; each param only belongs "
-                            "to a single bucket."
-                        )
-                        param_gbuf_map[param] = (gbuf_index, dtype, bucket_index)
+        param_gbuf_map = {
+            param: (gbuf_index, dtype, bucket_index)
+            for gbuf_index, dtype, bucket_index, param in flat_gbuf_entries
+        }
+        assert len(param_gbuf_map) == len(flat_gbuf_entries), (
+            "Param should not be in param_gbuf_map; each param only belongs "
+            "to a single bucket."
+        )
         return param_gbuf_map
 
     @classmethod
-    def _build_optimizer_group_ranges(cls, param_groups: List[Dict], gbuf_ranges: List[Dict]):
+    def _build_optimizer_group_ranges(cls, param_groups: List[Dict], flat_gbuf_entries: List[Tuple]):
         """
         Create optimizer groups.
 
@@ -271,11 +339,12 @@ class DistributedOptimizer(MixedPrecisionOptimizer):
         #   cross reference between the DDP mappings and the optimizer group
         #   parameters. This mapping only for use in the next step of building
         #   the local mapping over this DP rank's parameters.
-        world_param_group_map = {}
-        for group_index, group in enumerate(param_groups):
-            for param in group["params"]:
-                assert param.requires_grad
-                world_param_group_map[param] = group_index
+        assert all(param.requires_grad for group in param_groups for param in group["params"])
+        world_param_group_map = {
+            param: group_index
+            for group_index, group in enumerate(param_groups)
+            for param in group["params"]
+        }
 
         # Optimizer group ranges & param-group mapping.
         # - Build a mapping from groups to their contained parameters, and also
@@ -284,14 +353,11 @@ class DistributedOptimizer(MixedPrecisionOptimizer):
         #   saving and loading checkpoints.
         local_param_group_map = {}
         group_ranges = [{"params": []} for _ in param_groups]
-        for gbuf_range_map in gbuf_ranges:
-            for dtype, gbuf_range_map_for_all_buckets in gbuf_range_map.items():
-                for gbuf_range_map in gbuf_range_map_for_all_buckets:
-                    for param in gbuf_range_map["param_map"]:
-                        group_index = world_param_group_map[param]
-                        group_range = group_ranges[group_index]
-                        group_range["params"].append(param)
-                        local_param_group_map[param] = (group_index, len(group_range["params"]) - 1)
+        for _, _, _, param in flat_gbuf_entries:
+            group_index = world_param_group_map[param]
+            group_range = group_ranges[group_index]
+            group_range["params"].append(param)
+            local_param_group_map[param] = (group_index, len(group_range["params"]) - 1)
 
         # Squeeze zero-size group ranges.
         for group_index, group_range in enumerate(group_ranges):
@@ -331,6 +397,14 @@ class DistributedOptimizer(MixedPrecisionOptimizer):
         shard_fp32_groups = []
         shard_fp32_from_float16_groups = []
 
+        # Probe for FP8 params once, so the common non-FP8 case skips the
+        # per-param is_float8tensor() calls in the loop below.
+        any_fp8_params = any(
+            is_float8tensor(model_param)
+            for group_range in opt_group_ranges
+            for model_param in group_range["params"]
+        )
+
         # Allocate (or slice) each group's param shard.
         for group_range in opt_group_ranges:
 
@@ -346,30 +420,44 @@ class DistributedOptimizer(MixedPrecisionOptimizer):
             shard_fp32_groups.append(shard_fp32_params_this_group)
             shard_fp32_from_float16_groups.append(shard_fp32_from_float16_params_this_group)
 
+            # Common-case (non-FP8) main-param shards are materialized as views
+            # into a single contiguous fp32 buffer per group, filled with one
+            # grouped copy after the loop, instead of one clone().float() kernel
+            # launch per param. Entries: (model_param, shard_model_param,
+            # position in shard_fp32_from_float16_params_this_group).
+            deferred_main_param_entries = []
+
             for model_param in group_range["params"]:
 
                 assert model_param.requires_grad
 
                 gbuf_index, dtype, bucket_index = param_gbuf_map[model_param]
                 gbuf_range = gbuf_ranges[gbuf_index][dtype][bucket_index]
-                param_range = gbuf_range["param_map"][model_param]["param"]
+                param_range = gbuf_range["param_map"][model_param].param
 
                 # fp16, bf16 params.
-                if model_param.type() in ['torch.cuda.HalfTensor', 'torch.cuda.BFloat16Tensor']:
+                if model_param.dtype in _HALF_DTYPES:
+
+                    # Probe model-parallel and shared attributes once; they are
+                    # applied to both the model and main param shards.
+                    tp_attributes = _get_tensor_model_parallel_attributes(model_param)
+                    shared = getattr(model_param, 'shared', None)
 
                     # Generate sharded model param.
-                    if is_float8tensor(model_param) and config.fp8_recipe != "delayed":
+                    if (
+                        any_fp8_params
+                        and is_float8tensor(model_param)
+                        and config.fp8_recipe != "delayed"
+                    ):
                         # MXFP8Tensor and BlockwiseQTensor don't support view(-1)
                         shard_model_param = None
                     else:
                         shard_model_param = model_param.detach().view(-1)[
                             param_range.start : param_range.end
                         ]
-                        tensor_parallel.copy_tensor_model_parallel_attributes(
-                            shard_model_param, model_param
-                        )
-                        if hasattr(model_param, 'shared'):
-                            shard_model_param.shared = model_param.shared
+                        _set_tensor_model_parallel_attributes(shard_model_param, tp_attributes)
+                        if shared is not None:
+                            shard_model_param.shared = shared
 
                     # Generate main param.
                     if not config.use_precision_aware_optimizer_no_fp8_or_ds_fp8:
@@ -378,7 +466,7 @@ class DistributedOptimizer(MixedPrecisionOptimizer):
                         # precision at the beginning of training (this problem will not occur if the
                         # training is long enough or if the main params are loaded from a
                         # checkpoint).
-                        if is_float8tensor(model_param):
+                        if any_fp8_params and is_float8tensor(model_param):
                             if hasattr(model_param, 'get_high_precision_init_val'):
                                 shard_main_param = (
                                     model_param.get_high_precision_init_val()
@@ -393,13 +481,22 @@ class DistributedOptimizer(MixedPrecisionOptimizer):
                                     param_range.start : param_range.end
                                 ]
                         else:
-                            shard_main_param = shard_model_param.clone().float()
+                            # Deferred; overwritten below with a view into the
+                            # group's contiguous fp32 buffer.
+                            shard_main_param = None
+                            deferred_main_param_entries.append(
+                                (
+                                    model_param,
+                                    shard_model_param,
+                                    len(shard_fp32_from_float16_params_this_group),
+                                    tp_attributes,
+                                )
+                            )
 
-                        tensor_parallel.copy_tensor_model_parallel_attributes(
-                            shard_main_param, model_param
-                        )
-                        if hasattr(model_param, 'shared'):
-                            shard_main_param.shared = model_param.shared
+                        if shard_main_param is not None:
+                            _set_tensor_model_parallel_attributes(shard_main_param, tp_attributes)
+                            if shared is not None:
+                                shard_main_param.shared = shared
                     else:
                         # When using precision-aware optimizer, main params are held by FusedAdam.
                         shard_main_param = None
@@ -414,15 +511,16 @@ class DistributedOptimizer(MixedPrecisionOptimizer):
                     shard_fp32_from_float16_params_this_group.append(shard_main_param)
 
                 # fp32 params.
-                elif model_param.type() == 'torch.cuda.FloatTensor':
+                elif model_param.dtype == torch.float32:
                     shard_model_param = model_param.view(-1)[param_range.start : param_range.end]
                     model_fp32_params_this_group.append(model_param)
                     shard_fp32_params_this_group.append(shard_model_param)
-                    tensor_parallel.copy_tensor_model_parallel_attributes(
-                        shard_model_param, model_param
+                    _set_tensor_model_parallel_attributes(
+                        shard_model_param, _get_tensor_model_parallel_attributes(model_param)
                     )
-                    if hasattr(model_param, 'shared'):
-                        shard_model_param.shared = model_param.shared
+                    shared = getattr(model_param, 'shared', None)
+                    if shared is not None:
+                        shard_model_param.shared = shared
 
                 else:
                     raise TypeError(
@@ -433,6 +531,31 @@ class DistributedOptimizer(MixedPrecisionOptimizer):
                         'Received {}'.format(model_param.type())
                     )
 
+            # Materialize the deferred main-param shards: one allocation and one
+            # grouped copy for the whole group. Contiguous master state also
+            # improves locality in the optimizer step.
+            if deferred_main_param_entries:
+                shard_sizes = [shard.nelement() for _, shard, _, _ in deferred_main_param_entries]
+                flat_main_params = torch.empty(
+                    sum(shard_sizes),
+                    dtype=torch.float32,
+                    device=deferred_main_param_entries[0][1].device,
+                )
+                shard_main_params = torch.split(flat_main_params, shard_sizes)
+                torch._foreach_copy_(
+                    list(shard_main_params),
+                    [shard for _, shard, _, _ in deferred_main_param_entries],
+                )
+                for (model_param, _, group_order, tp_attributes), shard_main_param in zip(
+                    deferred_main_param_entries, shard_main_params
+                ):
+                    _set_tensor_model_parallel_attributes(shard_main_param, tp_attributes)
+                    shared = getattr(model_param, 'shared', None)
+                    if shared is not None:
+                        shard_main_param.shared = shared
+                    model_param.main_param = shard_main_param
+                    shard_fp32_from_float16_params_this_group[group_order] = shard_main_param
+
             # Update optimizer's params.
             if not config.use_precision_aware_optimizer_no_fp8_or_ds_fp8:
                 group_range["orig_group"]["params"] = [
@@ -508,6 +631,60 @@ class DistributedOptimizer(MixedPrecisionOptimizer):
             assert self.ddp_config == model_chunk.ddp_config
         self.distributed_optimizer_instance_id = distributed_optimizer_instance_id
 
+        # Background writer for save_parameter_state(); created lazily on the
+        # first save so non-saving ranks never spawn a thread.
+        self._parameter_state_save_executor: Optional[ThreadPoolExecutor] = None
+        self._pending_parameter_state_save: Optional[Future] = None
+
+        # Flat model-param -> main-param / optimizer-state lookups for the
+        # checkpoint paths; built lazily on first use and invalidated whenever
+        # the inner optimizer's state is replaced (see load_state_dict()).
+        self._param_to_main_param: Optional[Dict[torch.Tensor, torch.Tensor]] = None
+        self._param_to_optimizer_state: Optional[Dict[torch.Tensor, dict]] = None
+
+        # Ordered (model_param, param_slice) pairs for the "model space"
+        # param-state formats; built lazily since the traversal order over
+        # gbuf_ranges is fixed after init.
+        self._ordered_param_slices: Optional[List[Tuple[torch.Tensor, slice]]] = None
+
+        # Reusable pinned host buffers for checkpoint scatters (see
+        # _get_pinned_recv_tensor()).
+        self._pinned_recv_cache: Dict[Any, torch.Tensor] = {}
+
+        # Persistent rank-0 staging buffers for padding world tensors before
+        # checkpoint scatters (see _get_pad_buffer()).
+        self._pad_buf_cache: Dict[Any, torch.Tensor] = {}
+
+        # Persistent fp32 grad buffers for the float16 shard groups, so
+        # _copy_model_grads_to_main_grads() does not allocate a fresh fp32
+        # tensor per parameter every step (see that method).
+        self._shard_main_grad_buffers: Dict[torch.Tensor, torch.Tensor] = {}
+
+        # Cached copy plans for the per-step shard copy methods. The range-map
+        # lookups and buffer views are identical every step, so they are
+        # resolved once on first use and the steady-state methods only replay
+        # the cached (dst, src) lists.
+        self._grad_copy_plan: Optional[Tuple[list, list, list]] = None
+        self._param_copy_plan: Optional[Tuple[list, list]] = None
+        self._param_buffer_copy_plan: Optional[Tuple[list, list]] = None
+
+        # Cached result of _get_fp8_params_and_shard_fp32_from_fp8(), which
+        # otherwise re-scans every parameter of every buffer on each step.
+        self._fp8_param_shard_cache: Optional[Tuple[list, list, list]] = None
+
+        # Main grads as seen by the unscale / non-finite check: the flat slab
+        # backing the cast grads plus the fp32 grad-buffer aliases. Built
+        # together with _grad_copy_plan.
+        self._main_grad_unscale_views: Optional[list] = None
+        # Outstanding handle for the async packed fp8 amax all-reduce launched
+        # during _copy_main_params_to_model_params(); waited on in
+        # step_with_ready_grads() once the param all-gathers are in flight.
+        self._fp8_amax_reduce_handle = None
+        # Timer object for the param all-gather, resolved once instead of a
+        # string-keyed lookup on every step (config.timers may be attached
+        # after construction, hence lazy).
+        self._params_all_gather_timer = None
+
         assert (
             isinstance(optimizer, (Adam, torch.optim.AdamW, HybridDeviceOptimizer))
             or optimizer is None
@@ -534,38 +711,38 @@ class DistributedOptimizer(MixedPrecisionOptimizer):
         self.data_parallel_group_gloo = data_parallel_group_gloo
         self.data_parallel_group_idx = data_parallel_group_idx
 
-        self.gbuf_idx_to_model_idx_map = {}
-        gbuf_idx = 0
-        for model_idx, buffers in self.per_model_buffers.items():
-            for _ in buffers:
-                self.gbuf_idx_to_model_idx_map[gbuf_idx] = model_idx
-                gbuf_idx += 1
+        self.gbuf_idx_to_model_idx_map = {
+            gbuf_idx: model_idx
+            for gbuf_idx, model_idx in enumerate(
+                model_idx
+                for model_idx, buffers in self.per_model_buffers.items()
+                for _ in buffers
+            )
+        }
 
-        self.per_model_bucket_groups = {}
-        for model_idx, buffers in self.per_model_buffers.items():
-            self.per_model_bucket_groups[model_idx] = partition_buckets(buffers)
+        self.per_model_bucket_groups = {
+            model_idx: partition_buckets(buffers)
+            for model_idx, buffers in self.per_model_buffers.items()
+        }
 
         self.gbuf_ranges = []
         self.per_bucket_numel = []
         self.per_bucket_numel_unpadded = []
-        for buffer in self.buffers:
-
-            self.per_bucket_numel.append(
-                {
-                    (buffer.param_dtype, buffer.grad_dtype): [
-                        bucket.grad_data.numel() for bucket in buffer.buckets
-                    ]
-                }
-            )
+        self._flat_gbuf_entries = []
+        for gbuf_index, buffer in enumerate(self.buffers):
+            # Traverse the buffer's buckets once for both numel side-products.
+            bucket_numels = [
+                (bucket.grad_data.numel(), bucket.numel_unpadded) for bucket in buffer.buckets
+            ]
+            dtype_key = (buffer.param_dtype, buffer.grad_dtype)
+            self.per_bucket_numel.append({dtype_key: [numel for numel, _ in bucket_numels]})
             self.per_bucket_numel_unpadded.append(
-                {
-                    (buffer.param_dtype, buffer.grad_dtype): [
-                        bucket.numel_unpadded for bucket in buffer.buckets
-                    ]
-                }
+                {dtype_key: [numel_unpadded for _, numel_unpadded in bucket_numels]}
             )
-            self.gbuf_ranges.append(self._build_gbuf_range_map(buffer))
-        self.model_param_gbuf_map = self._build_model_param_gbuf_map(self.gbuf_ranges)
+            gbuf_range_map, flat_gbuf_entries = self._build_gbuf_range_map(buffer, gbuf_index)
+            self.gbuf_ranges.append(gbuf_range_map)
+            self._flat_gbuf_entries.extend(flat_gbuf_entries)
+        self.model_param_gbuf_map = self._build_model_param_gbuf_map(self._flat_gbuf_entries)
 
         # Add main_param field to each parameter. We will use this fp32 copy to compute
         # the param norm.
@@ -576,13 +753,13 @@ class DistributedOptimizer(MixedPrecisionOptimizer):
             for param in param_group['params']:
                 if param.requires_grad:
                     # fp32 copy only needed for 16-bit parameters.
-                    if param.type() in ['torch.cuda.HalfTensor', 'torch.cuda.BFloat16Tensor']:
+                    if param.dtype in _HALF_DTYPES:
                         param.main_param = None
                         param.main_param_sharded = True
 
         # Optimizer ranges.
         (self.model_param_group_index_map, self.opt_group_ranges) = (
-            self._build_optimizer_group_ranges(self.optimizer.param_groups, self.gbuf_ranges)
+            self._build_optimizer_group_ranges(self.optimizer.param_groups, self._flat_gbuf_entries)
         )
 
         # Allocate main param shards.
@@ -602,7 +779,11 @@ class DistributedOptimizer(MixedPrecisionOptimizer):
             )
         else:
             self.optimizer.param_groups = [g["orig_group"] for g in self.opt_group_ranges]
-            self.optimizer.load_state_dict(self.optimizer.state_dict())
+            if len(self.optimizer.state) > 0:
+                # Re-sync the inner optimizer's state references to the new
+                # param groups. At init the state is empty and this round-trip
+                # is a no-op, so skip the full dict traversal in that case.
+                self.optimizer.load_state_dict(self.optimizer.state_dict())
 
     def _get_model_param_range_map(self, param: torch.nn.Parameter):
         """
@@ -635,18 +816,18 @@ class DistributedOptimizer(MixedPrecisionOptimizer):
 
         # Extract 'step', for non-Apex/TE support.
         if not HAVE_APEX_OR_TE:
-            steps = list(set([s["step"].item() for s in inner_state_dict["state"].values()]))
-            assert len(steps) == 1
-            step = steps[0]
+            # All state entries share the same step by invariant; read a single
+            # entry instead of syncing every state tensor to host.
+            assert len(inner_state_dict["state"]) > 0
+            step = next(iter(inner_state_dict["state"].values()))["step"].item()
         elif isinstance(self.optimizer, HybridDeviceOptimizer):
             step = None
             for optimizer in self.optimizer.sub_optimizers:
                 if isinstance(optimizer, (torch.optim.Adam, torch.optim.AdamW)):
                     if len(optimizer.state) == 0:
                         continue
-                    steps = list(set([s["step"].item() for s in optimizer.state.values()]))
-                    assert len(steps) == 1, f"steps: {optimizer.state}"
-                    step = steps[0]
+                    # Same invariant as above: all entries share one step.
+                    step = next(iter(optimizer.state.values()))["step"].item()
                     break
         elif USING_TE_OPTIMIZER or USING_APEX_OPTIMIZER:
             # Extract 'step', for TE FusedAdam support.
@@ -769,7 +950,7 @@ class DistributedOptimizer(MixedPrecisionOptimizer):
             #   empty tensors (i.e., torch.empty), which in turn reduces memory
             #   fragmentation.
             # - Real data is overwritten during load_parameter_state().
-            state_dict_state = []
+            param_entries = []
             for gbuf_range_maps in self.gbuf_ranges:
                 for gbuf_range_map_for_all_buckets in gbuf_range_maps.values():
                     for gbuf_range_map in gbuf_range_map_for_all_buckets:
@@ -781,27 +962,39 @@ class DistributedOptimizer(MixedPrecisionOptimizer):
                             state_order = inner_state_dict["param_groups"][group_index]["params"][
                                 group_order
                             ]
-
-                            # Allocate dummy tensors.
-                            numel = len(param_range_map["gbuf_world"])
-                            init_shard = lambda dtype=torch.float32: torch.empty(
-                                (numel,), dtype=dtype, device=torch.cuda.current_device()
+                            param_entries.append(
+                                (state_order, len(param_range_map.gbuf_world))
                             )
 
-                            # For precision_aware_optimizer, the empty tensors should also be
-                            #  initialized with the correct dtype.
-                            tensors = {
-                                "exp_avg": init_shard(self.config.exp_avg_dtype),
-                                "exp_avg_sq": init_shard(self.config.exp_avg_sq_dtype),
-                            }
-                            if self.config.use_precision_aware_optimizer_no_fp8_or_ds_fp8:
-                                if self.config.store_param_remainders and self.config.bf16:
-                                    tensors["master_param"] = init_shard(torch.int16)
-                                else:
-                                    tensors["master_param"] = init_shard(
-                                        self.config.main_params_dtype
-                                    )
-                            state_dict_state.append((state_order, tensors))
+            # For precision_aware_optimizer, the empty tensors should also be
+            #  initialized with the correct dtype.
+            shard_dtypes = {
+                "exp_avg": self.config.exp_avg_dtype,
+                "exp_avg_sq": self.config.exp_avg_sq_dtype,
+            }
+            if self.config.use_precision_aware_optimizer_no_fp8_or_ds_fp8:
+                if self.config.store_param_remainders and self.config.bf16:
+                    shard_dtypes["master_param"] = torch.int16
+                else:
+                    shard_dtypes["master_param"] = self.config.main_params_dtype
+
+            # Allocate dummy tensors: one slab per state key, with each param's
+            # shard a contiguous view into it, instead of one small cudaMalloc
+            # per parameter per key.
+            total_numel = sum(numel for _, numel in param_entries)
+            current_device = torch.cuda.current_device()
+            shard_pools = {
+                key: torch.empty((total_numel,), dtype=dtype, device=current_device)
+                for key, dtype in shard_dtypes.items()
+            }
+            state_dict_state = []
+            offset = 0
+            for state_order, numel in param_entries:
+                tensors = {
+                    key: pool.narrow(0, offset, numel) for key, pool in shard_pools.items()
+                }
+                offset += numel
+                state_dict_state.append((state_order, tensors))
 
             # Sort by state order (see method docstring for details).
             state_dict_state.sort(key=lambda s: s[0])
@@ -811,11 +1004,14 @@ class DistributedOptimizer(MixedPrecisionOptimizer):
             # Retrieve existing optimizer state.
             state_dict_state = inner_state_dict["state"]
 
-        # Extract 'step', for non-Apex/TE support.
+        # Extract 'step', for non-Apex/TE support. All param groups are asserted
+        # to share one step value, so scan for it directly instead of building a
+        # set over every group.
         if not HAVE_APEX_OR_TE:
-            steps = list(set([g["step"] for g in state_dict["optimizer"]["param_groups"]]))
-            assert len(steps) == 1
-            step = torch.tensor(steps[0], dtype=torch.float)
+            param_groups = state_dict["optimizer"]["param_groups"]
+            step_value = param_groups[0]["step"]
+            assert all(g["step"] == step_value for g in param_groups)
+            step = torch.tensor(step_value, dtype=torch.float)
 
             for s in state_dict_state.values():
                 # Native PyTorch state dict requires step (i.e., iteration).
@@ -823,12 +1019,11 @@ class DistributedOptimizer(MixedPrecisionOptimizer):
         elif isinstance(self.optimizer, HybridDeviceOptimizer):
             # Handle Torch AdamW special case, which, unlike FusedAdam, Torch AdamW
             # has an extra optimizer state "step".
-            steps = list(
-                set([g["step"] for g in state_dict["optimizer"]["param_groups"] if "step" in g])
-            )
+            steps = [g["step"] for g in state_dict["optimizer"]["param_groups"] if "step" in g]
             if len(steps) != 0:
-                assert len(steps) == 1, f"steps: {steps}"
-                step = torch.tensor(steps[0], dtype=torch.float32, device="cpu")
+                step_value = steps[0]
+                assert all(s == step_value for s in steps), f"steps: {steps}"
+                step = torch.tensor(step_value, dtype=torch.float32, device="cpu")
                 for v in self.optimizer.state.values():
                     v["step"] = step.detach().clone()
 
@@ -837,6 +1032,11 @@ class DistributedOptimizer(MixedPrecisionOptimizer):
             {"state": state_dict_state, "param_groups": state_dict_param_groups}
         )
 
+        # The inner optimizer's state entries have been replaced, so any cached
+        # main-param/optimizer-state lookups are stale.
+        self._param_to_main_param = None
+        self._param_to_optimizer_state = None
+
         # Grad scaler.
         if 'grad_scaler' not in state_dict:
             if self.config.fp16:
@@ -869,6 +1069,22 @@ class DistributedOptimizer(MixedPrecisionOptimizer):
             else:
                 raise NotImplementedError(f'Unknown sharding_type: {sharding_type}')
 
+    def _build_main_param_and_optimizer_state_maps(self):
+        """Cache flat ``model_param -> main param / optimizer state`` lookups.
+
+        The checkpoint paths resolve every model param through
+        `model_param_group_index_map` plus two list indexings, inside loops that
+        run over every parameter in the model; resolve each param once here and
+        reuse the flat maps. The maps are invalidated whenever the inner
+        optimizer's state is replaced (see load_state_dict()).
+        """
+        self._param_to_main_param = {}
+        self._param_to_optimizer_state = {}
+        for model_param, (group_index, group_order) in self.model_param_group_index_map.items():
+            main_param = self.optimizer.param_groups[group_index]["params"][group_order]
+            self._param_to_main_param[model_param] = main_param
+            self._param_to_optimizer_state[model_param] = self.optimizer.state[main_param]
+
     def _get_main_param_and_optimizer_states(self, model_param):
         """Return a dict containing the main param and optimizer states corresponding to the input
         model_param.
@@ -880,20 +1096,22 @@ class DistributedOptimizer(MixedPrecisionOptimizer):
             "exp_avg_sq": torch.Tensor
         }
         """
-        group_index, group_order = self.model_param_group_index_map[model_param]
+        if self._param_to_main_param is None:
+            self._build_main_param_and_optimizer_state_maps()
         if self.config.use_precision_aware_optimizer_no_fp8_or_ds_fp8:
-            sharded_model_param = self.optimizer.param_groups[group_index]["params"][group_order]
+            sharded_model_param = self._param_to_main_param[model_param]
+            optim_state = self._param_to_optimizer_state[model_param]
             tensors = {}
-            for k in self.optimizer.state[sharded_model_param]:
+            for k in optim_state:
                 if isinstance(self.optimizer, HybridDeviceOptimizer):
-                    tensors[k] = self.optimizer.state[sharded_model_param][k]
+                    tensors[k] = optim_state[k]
                     continue
 
                 tensors[k] = self.optimizer.get_unscaled_state(sharded_model_param, k)
             tensors["param"] = tensors.pop("master_param")
         else:
-            main_param = self.optimizer.param_groups[group_index]["params"][group_order]
-            optim_state = self.optimizer.state[main_param]
+            main_param = self._param_to_main_param[model_param]
+            optim_state = self._param_to_optimizer_state[model_param]
             tensors = {"param": main_param, **optim_state}
         return tensors
 
@@ -907,14 +1125,16 @@ class DistributedOptimizer(MixedPrecisionOptimizer):
             "exp_avg_sq": torch.Tensor
         }
         """
-        group_index, group_order = self.model_param_group_index_map[model_param]
+        if self._param_to_main_param is None:
+            self._build_main_param_and_optimizer_state_maps()
         if self.config.use_precision_aware_optimizer_no_fp8_or_ds_fp8:
-            sharded_model_param = self.optimizer.param_groups[group_index]["params"][group_order]
+            sharded_model_param = self._param_to_main_param[model_param]
+            optim_state = self._param_to_optimizer_state[model_param]
             for k, v in tensors.items():
                 if isinstance(self.optimizer, HybridDeviceOptimizer):
                     if k == "param":
                         k = "master_param"
-                    self.optimizer.state[sharded_model_param][k] = v
+                    optim_state[k] = v
                     continue
 
                 if k == "param":
@@ -922,8 +1142,8 @@ class DistributedOptimizer(MixedPrecisionOptimizer):
                 else:
                     self.optimizer.set_scaled_state(sharded_model_param, k, v)
         else:
-            main_param = self.optimizer.param_groups[group_index]["params"][group_order]
-            optim_state = self.optimizer.state[main_param]
+            main_param = self._param_to_main_param[model_param]
+            optim_state = self._param_to_optimizer_state[model_param]
             dst_tensors = {"param": main_param, **optim_state}
             for key in dst_tensors:
                 dst_tensors[key].copy_(tensors[key])
@@ -953,8 +1173,8 @@ class DistributedOptimizer(MixedPrecisionOptimizer):
                         tensors = self._get_main_param_and_optimizer_states(model_param)
                         tensors.update(
                             {
-                                "gbuf_local_start": param_range_map["gbuf_local"].start,
-                                "gbuf_local_end": param_range_map["gbuf_local"].end,
+                                "gbuf_local_start": param_range_map.gbuf_local.start,
+                                "gbuf_local_end": param_range_map.gbuf_local.end,
                             }
                         )
                         bucket_state.append(tensors)
@@ -1004,8 +1224,98 @@ class DistributedOptimizer(MixedPrecisionOptimizer):
         data_parallel_world_size = data_parallel_group.size()
         data_parallel_rank = data_parallel_group.rank()
         data_parallel_global_ranks = torch.distributed.get_process_group_ranks(data_parallel_group)
+        current_device = torch.cuda.current_device()
+
+        def copy_gathered_bucket_to_world_tensors(
+            recv_buffer, world_tensors, local_shard_keys, start, end, staged_on_device
+        ):
+            """Copy one bucket's gathered [world, keys, n] buffer into the
+            coalesced world tensors, dropping the padding between buckets. A
+            device-side buffer is first staged to the host through one pinned
+            D2H copy."""
+            if staged_on_device:
+                recv_buffer_host = torch.empty(
+                    recv_buffer.shape, dtype=torch.float32, device="cpu", pin_memory=True
+                )
+                recv_buffer_host.copy_(recv_buffer, non_blocking=True)
+                torch.cuda.current_stream().synchronize()
+                recv_buffer = recv_buffer_host
+            # Copy straight out of the stacked buffer instead of materializing
+            # a concatenated per-key tensor; only the (partially padded) last
+            # rank shard needs separate handling.
+            shard_numel = recv_buffer.shape[-1]
+            num_full_shards = (end - start) // shard_numel
+            split = start + num_full_shards * shard_numel
+            for key_idx, key in enumerate(local_shard_keys):
+                if num_full_shards > 0:
+                    world_tensors[key][start:split].view(num_full_shards, shard_numel).copy_(
+                        recv_buffer[:num_full_shards, key_idx, :]
+                    )
+                if split < end:
+                    world_tensors[key][split:end].copy_(
+                        recv_buffer[num_full_shards, key_idx, : end - split]
+                    )
 
-        # Collect param states.
+        def complete_oldest_gather():
+            work, _, recv_buffer, world_tensors, start, end = pending_gathers.pop(0)
+            work.wait()
+            if data_parallel_rank == 0 or return_on_all_ranks:
+                copy_gathered_bucket_to_world_tensors(
+                    recv_buffer, world_tensors, local_shard_keys, start, end, staged_on_device=False
+                )
+
+        def flush_deferred_gathers():
+            # Issue the queued buckets' gathers inside one coalescing context
+            # so NCCL launches them as a single grouped collective, then stage
+            # and concatenate once the group completes. Flushing in bounded
+            # groups (rather than queueing every bucket) caps the GPU memory
+            # held by in-flight send and recv staging buffers: the recv side
+            # alone is dp_world x 3 x gbuf_local_numel fp32 per bucket, i.e.
+            # roughly the full fp32 optimizer state again if left unbounded.
+            if len(deferred_gathers) == 0:
+                return
+            with torch.distributed._coalescing_manager(
+                data_parallel_group, async_ops=True
+            ) as cm:
+                for send_tensor, recv_tensors, recv_buffer, _, _, _ in deferred_gathers:
+                    if return_on_all_ranks:
+                        # Gather into the stacked buffer directly: one
+                        # contiguous NCCL write instead of dp_world separate
+                        # receives into a list of views.
+                        torch.distributed.all_gather_into_tensor(
+                            recv_buffer, send_tensor, data_parallel_group
+                        )
+                    else:
+                        torch.distributed.gather(
+                            send_tensor,
+                            recv_tensors,
+                            data_parallel_global_ranks[0],
+                            data_parallel_group,
+                        )
+            cm.wait()
+            if data_parallel_rank == 0 or return_on_all_ranks:
+                for _, _, recv_buffer, world_tensors, start, end in deferred_gathers:
+                    copy_gathered_bucket_to_world_tensors(
+                        recv_buffer,
+                        world_tensors,
+                        local_shard_keys,
+                        start,
+                        end,
+                        staged_on_device=True,
+                    )
+            # Drop the group's send/recv staging buffers before queueing more.
+            deferred_gathers.clear()
+
+        # Collect param states. On the NCCL path the per-bucket gathers are
+        # issued in bounded coalesced groups (see flush_deferred_gathers
+        # above), so the collective launch overhead is paid once per group
+        # instead of once per bucket while the staging memory stays bounded.
+        # On the gloo path the gathers are pipelined through a bounded queue
+        # of async works (see complete_oldest_gather above).
+        deferred_gathers = []
+        pending_gathers = []
+        max_outstanding_gathers = 4
+        local_shard_keys = ("param", "exp_avg", "exp_avg_sq")
         state = {"buckets_coalesced": True}
         for gbuf_idx, gbuf_range_maps in enumerate(self.gbuf_ranges):
 
@@ -1017,9 +1327,16 @@ class DistributedOptimizer(MixedPrecisionOptimizer):
                 # Create coalesced tensors for all state related to parameters in this buffer.
                 world_tensors = {}
                 if data_parallel_rank == 0 or return_on_all_ranks:
+                    # exp_avg tolerates reduced-precision storage; param and
+                    # exp_avg_sq always stay fp32 (see ckpt_exp_avg_dtype).
+                    world_dtypes = {
+                        "param": torch.float32,
+                        "exp_avg": self.config.ckpt_exp_avg_dtype,
+                        "exp_avg_sq": torch.float32,
+                    }
                     world_tensors = {
                         key: torch.zeros(
-                            (buffer_numel_unpadded,), dtype=torch.float32, device="cpu"
+                            (buffer_numel_unpadded,), dtype=world_dtypes[key], device="cpu"
                         )
                         for key in ("param", "exp_avg", "exp_avg_sq")
                     }
@@ -1030,79 +1347,125 @@ class DistributedOptimizer(MixedPrecisionOptimizer):
                     for bucket_idx, gbuf_range_map in enumerate(gbuf_range_map_for_all_buckets):
 
                         # Compute local DP contiguous shard's size.
-                        gbuf_world_numel = (
-                            self.buffers[gbuf_idx].buckets[bucket_idx].grad_data.numel()
-                        )
+                        bucket = self.buffers[gbuf_idx].buckets[bucket_idx]
+                        gbuf_world_numel = bucket.grad_data.numel()
                         assert gbuf_world_numel % data_parallel_world_size == 0
                         gbuf_local_numel = gbuf_world_numel // data_parallel_world_size
 
-                        gbuf_world_numel_unpadded = (
-                            self.buffers[gbuf_idx].buckets[bucket_idx].numel_unpadded
-                        )
+                        gbuf_world_numel_unpadded = bucket.numel_unpadded
                         assert gbuf_world_numel_unpadded <= gbuf_world_numel
 
-                        local_shards = {
-                            key: torch.zeros((gbuf_local_numel,), dtype=torch.float32, device="cpu")
-                            for key in ("param", "exp_avg", "exp_avg_sq")
-                        }
+                        # One fused [3, gbuf_local_numel] shard for (param,
+                        # exp_avg, exp_avg_sq), so each bucket takes a single
+                        # gather instead of one per key. Stage it on device so
+                        # per-param copies stay on GPU; the host only sees one
+                        # pinned D2H per bucket (and none on the NCCL path).
+                        # When a bucket's states already live on the CPU
+                        # (offloaded optimizers), the gloo path packs them on
+                        # the host directly, skipping a wasted H2D/D2H round
+                        # trip through the device staging buffer.
+                        param_state_tensors = [
+                            self._get_main_param_and_optimizer_states(model_param)
+                            for model_param in gbuf_range_map["param_map"]
+                        ]
+                        stage_on_host = use_gloo_comm and all(
+                            tensors[key].device.type == "cpu"
+                            for tensors in param_state_tensors
+                            for key in local_shard_keys
+                        )
+                        local_shards_staging = torch.zeros(
+                            (len(local_shard_keys), gbuf_local_numel),
+                            dtype=torch.float32,
+                            device="cpu" if stage_on_host else current_device,
+                            pin_memory=stage_on_host,
+                        )
 
                         # Build contiguous DP rank shards (for param + optim states).
-                        for model_param, param_range_map in gbuf_range_map["param_map"].items():
-                            tensors = self._get_main_param_and_optimizer_states(model_param)
-
+                        for tensors, param_range_map in zip(
+                            param_state_tensors, gbuf_range_map["param_map"].values()
+                        ):
                             # Copy states into contiguous shard.
-                            gbuf_local_start = param_range_map["gbuf_local"].start
-                            gbuf_local_end = param_range_map["gbuf_local"].end
-                            for key in local_shards:
-                                local_shards[key][gbuf_local_start:gbuf_local_end].data.copy_(
-                                    tensors[key].detach().cpu()
+                            gbuf_local_start = param_range_map.gbuf_local.start
+                            gbuf_local_end = param_range_map.gbuf_local.end
+                            for key_idx, key in enumerate(local_shard_keys):
+                                local_shards_staging[
+                                    key_idx, gbuf_local_start:gbuf_local_end
+                                ].data.copy_(
+                                    tensors[key].detach(), non_blocking=not stage_on_host
                                 )
 
-                        # Gather contiguous shards on DP rank 0.
-                        for key, send_tensor in local_shards.items():
-
-                            # Gather tensor list.
-                            if data_parallel_rank == 0 or return_on_all_ranks:
-                                device = "cpu" if use_gloo_comm else torch.cuda.current_device()
-                                recv_tensors = [
-                                    torch.zeros(
-                                        (gbuf_local_numel,), dtype=torch.float32, device=device
-                                    )
-                                    for _ in range(data_parallel_world_size)
-                                ]
-                            else:
-                                recv_tensors = None
-
-                            # Gather.
-                            if not use_gloo_comm:
-                                send_tensor = send_tensor.cuda()
+                        if use_gloo_comm and not stage_on_host:
+                            local_shards = torch.empty(
+                                (len(local_shard_keys), gbuf_local_numel),
+                                dtype=torch.float32,
+                                device="cpu",
+                                pin_memory=True,
+                            )
+                            local_shards.copy_(local_shards_staging, non_blocking=True)
+                            torch.cuda.current_stream().synchronize()
+                        else:
+                            # Already on the host, or consumed directly by the
+                            # NCCL gather.
+                            local_shards = local_shards_staging
+
+                        # Gather the fused shards on DP rank 0.
+                        send_tensor = local_shards
+
+                        # Gather tensor list: one [world, keys, n] buffer per
+                        # bucket (unbound into per-rank views for the gather)
+                        # rather than dp_world separate zero-filled tensors.
+                        if data_parallel_rank == 0 or return_on_all_ranks:
+                            device = "cpu" if use_gloo_comm else current_device
+                            recv_buffer = torch.empty(
+                                (
+                                    data_parallel_world_size,
+                                    len(local_shard_keys),
+                                    gbuf_local_numel,
+                                ),
+                                dtype=torch.float32,
+                                device=device,
+                                pin_memory=use_gloo_comm,
+                            )
+                            recv_tensors = list(recv_buffer.unbind(0))
+                        else:
+                            recv_buffer = None
+                            recv_tensors = None
+
+                        start = offset_in_world_tensors
+                        end = offset_in_world_tensors + gbuf_world_numel_unpadded
+                        if use_gloo_comm:
+                            # Gather asynchronously: rank 0 post-processes
+                            # completed buckets while later gathers are still
+                            # on the wire, instead of idling on each one.
                             if return_on_all_ranks:
-                                torch.distributed.all_gather(
-                                    recv_tensors, send_tensor, data_parallel_group
+                                work = torch.distributed.all_gather(
+                                    recv_tensors, send_tensor, data_parallel_group, async_op=True
                                 )
                             else:
-                                torch.distributed.gather(
+                                work = torch.distributed.gather(
                                     send_tensor,
                                     recv_tensors,
                                     data_parallel_global_ranks[0],
                                     data_parallel_group,
+                                    async_op=True,
                                 )
-
-                            send_tensor = None  # allow mem deallocation
-
-                            # Concatenate.
-                            if data_parallel_rank == 0 or return_on_all_ranks:
-                                if not use_gloo_comm:
-                                    recv_tensors = [t.cpu() for t in recv_tensors]
-                                recv_tensors_concatenated = torch.cat(recv_tensors)
-                                # Copy this bucket's collected all-gather tensors into the right
-                                # place in the tensor for the buffer. The tensor for the buffer
-                                # gets rid of the padding between buckets.
-                                start = offset_in_world_tensors
-                                end = offset_in_world_tensors + gbuf_world_numel_unpadded
-                                world_tensors[key][start:end].copy_(
-                                    recv_tensors_concatenated[:gbuf_world_numel_unpadded]
-                                )
+                            # The send tensor must stay alive until the work
+                            # completes.
+                            pending_gathers.append(
+                                (work, send_tensor, recv_buffer, world_tensors, start, end)
+                            )
+                            # Bound the outstanding gathers to limit the host
+                            # memory held by in-flight buckets.
+                            while len(pending_gathers) >= max_outstanding_gathers:
+                                complete_oldest_gather()
+                        else:
+                            # Issued coalesced with up to max_outstanding_gathers
+                            # other buckets.
+                            deferred_gathers.append(
+                                (send_tensor, recv_tensors, recv_buffer, world_tensors, start, end)
+                            )
+                            if len(deferred_gathers) >= max_outstanding_gathers:
+                                flush_deferred_gathers()
 
                         offset_in_world_tensors += gbuf_world_numel_unpadded
 
@@ -1110,18 +1473,52 @@ class DistributedOptimizer(MixedPrecisionOptimizer):
                 dtype_state[dtype] = world_tensors
             state[gbuf_idx] = dtype_state
 
+        while len(pending_gathers) > 0:
+            complete_oldest_gather()
+        flush_deferred_gathers()
+
         return state if data_parallel_rank == 0 or return_on_all_ranks else None
 
+    @staticmethod
+    def _write_parameter_state_to_disk(state_dict, filename: str):
+        """Serialize the parameter state with a large write buffer, so the
+        serializer issues a few big sequential writes instead of one small
+        write per tensor record."""
+        with open(filename, "wb", buffering=64 << 20) as f:
+            torch.save(state_dict, f)
+
     def save_parameter_state(self, filename: str):
         """Save the distributed parameter state on DP rank 0.
 
+        The gather and D2H staging run synchronously on the calling thread;
+        the torch.save serialization and file write are handed off to a
+        background worker so training resumes while the checkpoint is
+        flushed. A subsequent save waits for the previous write to finish
+        before reusing the worker (see also finalize_parameter_state_save()).
+
         Args:
             filename (str): path to save parameter state to.
         """
 
-        state_dict = self.get_parameter_state_dp_zero()
+        # Serialize with any in-flight write of a previous checkpoint.
+        self.finalize_parameter_state_save()
+
+        # Gather over NCCL: the large FP32 shards move over NVLink/IB instead
+        # of the TCP-based gloo group, and land on the host via pinned-memory
+        # staging inside get_parameter_state_dp_zero().
+        state_dict = self.get_parameter_state_dp_zero(use_gloo_comm=False)
         if self.data_parallel_group.rank() == 0:
-            torch.save(state_dict, filename)
+            if self._parameter_state_save_executor is None:
+                self._parameter_state_save_executor = ThreadPoolExecutor(max_workers=1)
+            self._pending_parameter_state_save = self._parameter_state_save_executor.submit(
+                self._write_parameter_state_to_disk, state_dict, filename
+            )
+
+    def finalize_parameter_state_save(self):
+        """Block until any in-flight background parameter-state write completes."""
+        if self._pending_parameter_state_save is not None:
+            self._pending_parameter_state_save.result()
+            self._pending_parameter_state_save = None
 
     def _init_optimizer_states_with_dummy_values(self):
         # Initializes optimizer states with dummy values.
@@ -1140,6 +1537,85 @@ class DistributedOptimizer(MixedPrecisionOptimizer):
         self.optimizer.step()
         self.optimizer.zero_grad()
 
+    def _get_ordered_param_slices(self):
+        """Return ordered (model_param, param_slice) pairs for the "model
+        space" param-state formats.
+
+        The traversal order over `gbuf_ranges` defines the param indices those
+        formats store, so it is computed once and shared between save and load.
+        """
+        if self._ordered_param_slices is None:
+            ordered_param_slices = []
+            for gbuf_range_maps in self.gbuf_ranges:
+                for gbuf_range_map_for_all_buckets in gbuf_range_maps.values():
+                    for gbuf_range_map in gbuf_range_map_for_all_buckets:
+                        for model_param, param_range_map in gbuf_range_map["param_map"].items():
+                            param_range = param_range_map.param
+                            ordered_param_slices.append(
+                                (model_param, slice(param_range.start, param_range.end))
+                            )
+            self._ordered_param_slices = ordered_param_slices
+        return self._ordered_param_slices
+
+    def _ensure_state_allocated(self):
+        """Materialize placeholder optimizer state ahead of a checkpoint load.
+
+        The sharded param-state formats reference the live optimizer state
+        tensors, which the checkpoint loader then fills in place. Allocate any
+        missing state directly instead of round-tripping the whole optimizer
+        state through load_state_dict(self.state_dict()), which materializes
+        and re-loads every state tensor just for this side effect. No-op when
+        the state is already initialized, to avoid re-allocation and the
+        associated memory fragmentation.
+        """
+        if len(self.optimizer.state) > 0:
+            return
+
+        main_params = []
+        param_numels = []
+        for gbuf_range_maps in self.gbuf_ranges:
+            for gbuf_range_map_for_all_buckets in gbuf_range_maps.values():
+                for gbuf_range_map in gbuf_range_map_for_all_buckets:
+                    for model_param, param_range_map in gbuf_range_map["param_map"].items():
+                        group_index, group_order = self.model_param_group_index_map[model_param]
+                        main_params.append(
+                            self.optimizer.param_groups[group_index]["params"][group_order]
+                        )
+                        param_numels.append(len(param_range_map.gbuf_world))
+
+        shard_dtypes = {
+            "exp_avg": self.config.exp_avg_dtype,
+            "exp_avg_sq": self.config.exp_avg_sq_dtype,
+        }
+        if self.config.use_precision_aware_optimizer_no_fp8_or_ds_fp8:
+            if self.config.store_param_remainders and self.config.bf16:
+                shard_dtypes["master_param"] = torch.int16
+            else:
+                shard_dtypes["master_param"] = self.config.main_params_dtype
+
+        # One slab per state key, with each param's shard a contiguous view
+        # (see the matching allocation in load_state_dict()).
+        total_numel = sum(param_numels)
+        current_device = torch.cuda.current_device()
+        shard_pools = {
+            key: torch.empty((total_numel,), dtype=dtype, device=current_device)
+            for key, dtype in shard_dtypes.items()
+        }
+        # Native PyTorch optimizers require 'step' in the state; the real value
+        # arrives with the checkpoint.
+        step = None if HAVE_APEX_OR_TE else torch.tensor(0.0, dtype=torch.float)
+        offset = 0
+        for main_param, numel in zip(main_params, param_numels):
+            tensors = {key: pool.narrow(0, offset, numel) for key, pool in shard_pools.items()}
+            if step is not None:
+                tensors["step"] = step
+            self.optimizer.state[main_param] = tensors
+            offset += numel
+
+        # The state entries were replaced, so any cached lookups are stale.
+        self._param_to_main_param = None
+        self._param_to_optimizer_state = None
+
     def _param_name(self, param: torch.nn.Parameter) -> str:
         """Get the name of the parameter."""
         if not hasattr(self, "param_to_name"):
@@ -1247,10 +1723,16 @@ class DistributedOptimizer(MixedPrecisionOptimizer):
             }
 
         if is_loading:
-            # Call the distributed optimizer's specialized load_state_dict(),
-            # which conditionally skips re-allocating the optimizer's state if
-            # already initialized, which in turn reduces memory fragmentation.
-            self.load_state_dict(self.state_dict())
+            if isinstance(self.optimizer, HybridDeviceOptimizer):
+                # HybridDeviceOptimizer keeps its state synchronized with
+                # sub-optimizers inside load_state_dict(), so keep the full
+                # round trip for it.
+                self.load_state_dict(self.state_dict())
+            else:
+                # Materialize the optimizer state the sharded param-state
+                # formats will reference, without round-tripping the entire
+                # state dict through load_state_dict().
+                self._ensure_state_allocated()
         if sharding_type == 'dp_reshardable':
             param_state = self.sharded_param_state_dp_reshardable(
                 model_sharded_state_dict, is_loading, metadata
@@ -1577,10 +2059,9 @@ class DistributedOptimizer(MixedPrecisionOptimizer):
             for dtype, gbuf_range_map_for_all_buckets in state[gbuf_idx].items():
                 for bucket_idx, bucket_state in enumerate(gbuf_range_map_for_all_buckets):
                     # Compute local DP contiguous shard's size.
-                    gbuf_world_numel_unpadded = (
-                        self.buffers[gbuf_idx].buckets[bucket_idx].numel_unpadded
-                    )
-                    gbuf_world_numel = self.buffers[gbuf_idx].buckets[bucket_idx].grad_data.numel()
+                    bucket = self.buffers[gbuf_idx].buckets[bucket_idx]
+                    gbuf_world_numel_unpadded = bucket.numel_unpadded
+                    gbuf_world_numel = bucket.grad_data.numel()
                     assert gbuf_world_numel_unpadded <= gbuf_world_numel
                     assert gbuf_world_numel % data_parallel_world_size == 0
                     gbuf_local_numel = gbuf_world_numel // data_parallel_world_size
@@ -1594,9 +2075,16 @@ class DistributedOptimizer(MixedPrecisionOptimizer):
                     # We add extra empty padding if necessary
                     assert bucket_state, 'empty bucket encountered'
 
-                    # Insert padding between parameter tensors to ensure full coverage as needed.
-                    all_pad_tensors = {}
+                    # Insert padding between parameter tensors to ensure full coverage as
+                    # needed. The padded list is built in one forward pass; repeated
+                    # list.insert() would be O(n) per insertion, i.e. O(n^2) per bucket.
+                    tensor_keys = [
+                        k for k, v in bucket_state[0].items() if isinstance(v, torch.Tensor)
+                    ]
+                    padded_bucket_state = []
                     for i in range(-1, len(bucket_state)):
+                        if i >= 0:
+                            padded_bucket_state.append(bucket_state[i])
                         if i == len(bucket_state) - 1:
                             # Potential padding at the end
                             next_param_start = gbuf_local_numel
@@ -1614,24 +2102,24 @@ class DistributedOptimizer(MixedPrecisionOptimizer):
                             next_param_start != cur_param_end
                             and world_param_end < gbuf_world_numel_unpadded
                         ):
+                            reference_tensors = bucket_state[i]
                             pad_tensors = {
                                 k: torch.empty(
-                                    next_param_start - cur_param_end, dtype=v.dtype, device=v.device
+                                    next_param_start - cur_param_end,
+                                    dtype=reference_tensors[k].dtype,
+                                    device=reference_tensors[k].device,
                                 )
-                                for k, v in bucket_state[i].items()
-                                if isinstance(v, torch.Tensor)
+                                for k in tensor_keys
                             }
-                            all_pad_tensors[i + 1] = {
-                                **pad_tensors,
-                                'gbuf_local_start': cur_param_end,
-                                'gbuf_local_end': next_param_start,
-                                'padding': True,
-                            }
-
-                    # Insert from end so that insertion positions are still correct.
-                    indices_to_insert = sorted(list(all_pad_tensors.keys()))
-                    for index_to_insert in reversed(indices_to_insert):
-                        bucket_state.insert(index_to_insert, all_pad_tensors[index_to_insert])
+                            padded_bucket_state.append(
+                                {
+                                    **pad_tensors,
+                                    'gbuf_local_start': cur_param_end,
+                                    'gbuf_local_end': next_param_start,
+                                    'padding': True,
+                                }
+                            )
+                    bucket_state[:] = padded_bucket_state
 
                     # Each tensor is mapped to a slice
                     # of a DP-local shard of size `gbuf_local_numel`.
@@ -1736,17 +2224,8 @@ class DistributedOptimizer(MixedPrecisionOptimizer):
 
         # Not stored in the checkpoint, used only to identify params in
         # `sharded_param_state_fs_model_space`.
-        param_idx = 0
-        for gbuf_range_maps in self.gbuf_ranges:
-            for gbuf_range_map_for_all_buckets in gbuf_range_maps.values():
-                for gbuf_range_map in gbuf_range_map_for_all_buckets:
-                    for model_param, param_range_map in gbuf_range_map["param_map"].items():
-                        param_range = param_range_map['param']
-                        tensors = _get_param_state_sharded_tensors(
-                            model_param, slice(param_range.start, param_range.end)
-                        )
-                        state[param_idx] = tensors
-                        param_idx += 1
+        for param_idx, (model_param, item_slice) in enumerate(self._get_ordered_param_slices()):
+            state[param_idx] = _get_param_state_sharded_tensors(model_param, item_slice)
         return state
 
     def load_parameter_state_from_dp_reshardable(self, state_dict):
@@ -1762,6 +2241,12 @@ class DistributedOptimizer(MixedPrecisionOptimizer):
                 f"({per_bucket_numel_unpadded_in_checkpoint})"
             )
 
+        # Issue the bucket copies on a dedicated stream so the driver can queue
+        # them back to back; the host blocks once at the end instead of on
+        # every copy.
+        load_stream = torch.cuda.Stream()
+        load_stream.wait_stream(torch.cuda.current_stream())
+
         for gbuf_idx, gbuf_range_maps in enumerate(self.gbuf_ranges):
             assert len(gbuf_range_maps) == 1, "single dtype supported, for now."
             for dtype, gbuf_range_map_for_all_buckets in gbuf_range_maps.items():
@@ -1777,11 +2262,34 @@ class DistributedOptimizer(MixedPrecisionOptimizer):
                         len(bucket_state),
                         len(gbuf_range_map["param_map"]),
                     )
-                    for src_tensors, (model_param, param_range_map) in zip(
-                        bucket_state, gbuf_range_map["param_map"].items()
-                    ):
-                        # Main param & optimizer states.
-                        self._set_main_param_and_optimizer_states(model_param, src_tensors)
+                    if self.config.use_precision_aware_optimizer_no_fp8_or_ds_fp8:
+                        for src_tensors, (model_param, param_range_map) in zip(
+                            bucket_state, gbuf_range_map["param_map"].items()
+                        ):
+                            # Main param & optimizer states.
+                            self._set_main_param_and_optimizer_states(model_param, src_tensors)
+                    else:
+                        # Batch this bucket's per-(param, key) copies into one
+                        # grouped copy instead of launching a tiny kernel per
+                        # parameter per state key.
+                        dst_tensors_flat = []
+                        src_tensors_flat = []
+                        for src_tensors, (model_param, param_range_map) in zip(
+                            bucket_state, gbuf_range_map["param_map"].items()
+                        ):
+                            dst_tensors = self._get_main_param_and_optimizer_states(model_param)
+                            for key, dst_tensor in dst_tensors.items():
+                                dst_tensors_flat.append(dst_tensor)
+                                src_tensors_flat.append(src_tensors[key])
+                        if len(dst_tensors_flat) > 0:
+                            with torch.cuda.stream(load_stream):
+                                torch._foreach_copy_(
+                                    dst_tensors_flat, src_tensors_flat, non_blocking=True
+                                )
+
+        # Checkpoint source tensors may be freed once this method returns, so
+        # block until every queued copy has landed.
+        load_stream.synchronize()
 
     @torch.no_grad()
     def load_parameter_state_from_fs_model_space(self, state_dict):
@@ -1789,22 +2297,38 @@ class DistributedOptimizer(MixedPrecisionOptimizer):
 
         Inverse of the `sharded_param_state_fs_model_space` method.
         """
-        param_idx = 0  # matching order with `sharded_param_state_fs_model_space`
-        for gbuf_range_maps in self.gbuf_ranges:
-            for gbuf_range_map_for_all_buckets in gbuf_range_maps.values():
-                for gbuf_range_map in gbuf_range_map_for_all_buckets:
-                    for model_param, param_range_map in gbuf_range_map["param_map"].items():
-                        src_tensors = {}
-                        for k, v in state_dict[param_idx].items():
-                            if k == "step":
-                                # Handle torch Adam "step" state separately.
-                                continue
-                            if k == "fp32_param":
-                                src_tensors["param"] = v
-                            else:
-                                src_tensors[k] = v
-                        self._set_main_param_and_optimizer_states(model_param, src_tensors)
-                        param_idx += 1
+        # Matching order with `sharded_param_state_fs_model_space`.
+        if self.config.use_precision_aware_optimizer_no_fp8_or_ds_fp8:
+            # Scaled-state setters cannot be batched; keep the per-param path.
+            for param_idx, (model_param, _) in enumerate(self._get_ordered_param_slices()):
+                src_tensors = {}
+                for k, v in state_dict[param_idx].items():
+                    if k == "step":
+                        # Handle torch Adam "step" state separately.
+                        continue
+                    if k == "fp32_param":
+                        src_tensors["param"] = v
+                    else:
+                        src_tensors[k] = v
+                self._set_main_param_and_optimizer_states(model_param, src_tensors)
+        else:
+            # The destination tensors come from the cached param/state maps,
+            # so the loop below is free of per-param group-index lookups, and
+            # all copies run as one grouped kernel.
+            dst_tensors_flat = []
+            src_tensors_flat = []
+            for param_idx, (model_param, _) in enumerate(self._get_ordered_param_slices()):
+                src_tensors = state_dict[param_idx]
+                dst_tensors = self._get_main_param_and_optimizer_states(model_param)
+                for key, dst_tensor in dst_tensors.items():
+                    if key == "step":
+                        # Handle torch Adam "step" state separately.
+                        continue
+                    src_key = "fp32_param" if key == "param" else key
+                    dst_tensors_flat.append(dst_tensor)
+                    src_tensors_flat.append(src_tensors[src_key])
+            if len(dst_tensors_flat) > 0:
+                torch._foreach_copy_(dst_tensors_flat, src_tensors_flat)
         if isinstance(self.optimizer, HybridDeviceOptimizer):
             self.optimizer._sync_hdo_state_to_sub_optimizers()
 
@@ -1818,16 +2342,111 @@ class DistributedOptimizer(MixedPrecisionOptimizer):
 
         assert old_total == new_total
 
-        unified_tensor = torch.cat(old_tensors, dim=0)
-
+        # Two-cursor walk instead of concatenating everything into one giant
+        # tensor: a new bucket that falls entirely inside one old bucket
+        # aliases it as a view, and only buckets straddling an old boundary
+        # are materialized. The aligned (common) case thus avoids doubling
+        # peak RAM on multi-GB checkpoints.
         new_tensors = []
-        start_idx = 0
+        old_idx = 0
+        old_offset = 0
         for new_numel in new_numels:
-            new_tensors.append(unified_tensor[start_idx : (start_idx + new_numel)])
-            start_idx += new_numel
+            if old_offset + new_numel <= old_tensors[old_idx].numel():
+                new_tensor = old_tensors[old_idx][old_offset : old_offset + new_numel]
+                old_offset += new_numel
+            else:
+                new_tensor = torch.empty((new_numel,), dtype=old_tensors[old_idx].dtype)
+                filled = 0
+                while filled < new_numel:
+                    old_tensor = old_tensors[old_idx]
+                    take = min(new_numel - filled, old_tensor.numel() - old_offset)
+                    new_tensor[filled : filled + take].copy_(
+                        old_tensor[old_offset : old_offset + take]
+                    )
+                    filled += take
+                    old_offset += take
+                    if old_offset == old_tensor.numel() and filled < new_numel:
+                        old_idx += 1
+                        old_offset = 0
+            if old_idx < len(old_tensors) and old_offset == old_tensors[old_idx].numel():
+                old_idx += 1
+                old_offset = 0
+            new_tensors.append(new_tensor)
 
         return new_tensors
 
+    def _get_pinned_recv_tensor(self, cache_key, numel):
+        """Return a reusable pinned host tensor for a checkpoint scatter.
+
+        Pinned allocations are expensive, and an H2D copy from pageable memory
+        serializes against the staging memcpy, so the scatter destinations are
+        pinned and cached per (gbuf, key, bucket). The contents are always
+        overwritten by the scatter, hence torch.empty.
+        """
+        recv_tensor = self._pinned_recv_cache.get(cache_key)
+        if recv_tensor is None or recv_tensor.numel() != numel:
+            recv_tensor = torch.empty((numel,), dtype=torch.float32, pin_memory=True)
+            self._pinned_recv_cache[cache_key] = recv_tensor
+        return recv_tensor
+
+    @staticmethod
+    def _coalesce_copy_plan(dsts, srcs):
+        """Merge adjacent (dst, src) copy pairs into spanning flat views.
+
+        Within a bucket, the per-param shard ranges are contiguous runs of the
+        same grad buffer, and plan destinations carved from a slab are
+        contiguous by construction. Runs of per-param copies therefore
+        collapse into one large copy per contiguous run, turning a
+        launch-bound tensorlist into a few throughput-bound kernels.
+
+        Pairs only merge when both views live in the same underlying storage:
+        raw data_ptr adjacency alone can also hold for tensors from different
+        storages that the caching allocator placed back-to-back, and extending
+        the first view with as_strided across a storage boundary would either
+        raise or silently read a neighboring tensor's bytes.
+        """
+        if not dsts:
+            return dsts, srcs
+        merged_dsts = [dsts[0]]
+        merged_srcs = [srcs[0]]
+        for dst, src in zip(dsts[1:], srcs[1:]):
+            prev_dst = merged_dsts[-1]
+            prev_src = merged_srcs[-1]
+            if (
+                src.dtype == prev_src.dtype
+                and src.device == prev_src.device
+                and dst.dtype == prev_dst.dtype
+                and prev_src.is_contiguous()
+                and src.is_contiguous()
+                and src.untyped_storage().data_ptr() == prev_src.untyped_storage().data_ptr()
+                and dst.untyped_storage().data_ptr() == prev_dst.untyped_storage().data_ptr()
+                and prev_src.data_ptr() + prev_src.nelement() * prev_src.element_size()
+                == src.data_ptr()
+                and prev_dst.data_ptr() + prev_dst.nelement() * prev_dst.element_size()
+                == dst.data_ptr()
+            ):
+                run_numel = prev_src.nelement() + src.nelement()
+                merged_srcs[-1] = prev_src.as_strided((run_numel,), (1,))
+                merged_dsts[-1] = prev_dst.as_strided((run_numel,), (1,))
+            else:
+                merged_dsts.append(dst)
+                merged_srcs.append(src)
+        return merged_dsts, merged_srcs
+
+    def _get_pad_buffer(self, cache_key, numel):
+        """Return a persistent fp32 staging buffer for padding a world tensor.
+
+        torch.nn.functional.pad always allocates a fresh gbuf_world_numel
+        tensor; for multi-GB buckets that allocation (and the extra memcpy it
+        implies) dominates rank 0's scatter prep. Copying into a cached buffer
+        instead also fuses any checkpoint-dtype cast into the same memcpy.
+        """
+        pad_buf = self._pad_buf_cache.get(cache_key)
+        if pad_buf is None or pad_buf.numel() != numel:
+            pad_buf = torch.empty((numel,), dtype=torch.float32)
+            self._pad_buf_cache[cache_key] = pad_buf
+        return pad_buf
+
     def load_parameter_state_from_dp_zero_legacy(self, state_dict):
         """Load parameter state (i.e., parameter & optimizer tensors) from DP 0 rank,
         using the legacy checkpoint format as described below.
@@ -1843,6 +2462,11 @@ class DistributedOptimizer(MixedPrecisionOptimizer):
         update a legacy-format checkpoint to the modern format.
         """
 
+        # H2D copies of the scattered shards run on a dedicated stream, so the
+        # next bucket's scatter overlaps the previous bucket's DMA.
+        load_stream = torch.cuda.Stream()
+        load_stream.wait_stream(torch.cuda.current_stream())
+
         # Data parallelism variables.
         assert self.data_parallel_group_gloo is not None
         data_parallel_world_size = self.data_parallel_group_gloo.size()
@@ -1873,19 +2497,16 @@ class DistributedOptimizer(MixedPrecisionOptimizer):
                     offset_in_world_tensors = 0
                     for bucket_idx, gbuf_range_map in enumerate(gbuf_range_map_for_all_buckets):
                         # Compute local DP contiguous shard's size.
-                        gbuf_world_numel = (
-                            self.buffers[gbuf_idx].buckets[bucket_idx].grad_data.numel()
-                        )
+                        bucket = self.buffers[gbuf_idx].buckets[bucket_idx]
+                        gbuf_world_numel = bucket.grad_data.numel()
                         assert gbuf_world_numel % data_parallel_world_size == 0
                         gbuf_local_numel = gbuf_world_numel // data_parallel_world_size
-                        gbuf_world_numel_unpadded = (
-                            self.buffers[gbuf_idx].buckets[bucket_idx].numel_unpadded
-                        )
+                        gbuf_world_numel_unpadded = bucket.numel_unpadded
                         assert gbuf_world_numel_unpadded <= gbuf_world_numel
 
                         # Contiguous local shards (received from DP rank 0).
-                        recv_tensor = torch.zeros(
-                            (gbuf_local_numel,), dtype=torch.float32, device="cpu"
+                        recv_tensor = self._get_pinned_recv_tensor(
+                            (gbuf_idx, key, bucket_idx), gbuf_local_numel
                         )
 
                         # Scatter tensor list.
@@ -1902,14 +2523,12 @@ class DistributedOptimizer(MixedPrecisionOptimizer):
 
                             # Pad world_tensor to gbuf_world_numel. Don't pad at the front,
                             # pad at the back.
-                            world_tensor = torch.nn.functional.pad(
-                                world_tensor, (0, gbuf_world_numel - gbuf_world_numel_unpadded)
-                            )
-                            assert world_tensor.numel() == gbuf_world_numel
-                            gbuf_start_idxs = list(range(0, gbuf_world_numel, gbuf_local_numel))
-                            send_tensors = [
-                                world_tensor[i : (i + gbuf_local_numel)] for i in gbuf_start_idxs
-                            ]
+                            padded = self._get_pad_buffer((gbuf_world_numel, key), gbuf_world_numel)
+                            padded[:gbuf_world_numel_unpadded].copy_(world_tensor)
+                            if gbuf_world_numel_unpadded < gbuf_world_numel:
+                                padded[gbuf_world_numel_unpadded:].zero_()
+                            world_tensor = padded
+                            send_tensors = list(torch.split(world_tensor, gbuf_local_numel))
                         else:
                             send_tensors = None
 
@@ -1925,24 +2544,30 @@ class DistributedOptimizer(MixedPrecisionOptimizer):
                         for model_param, param_range_map in gbuf_range_map["param_map"].items():
 
                             # Main param & optimizer states.
-                            group_index, group_order = self.model_param_group_index_map[model_param]
-                            main_param = self.optimizer.param_groups[group_index]["params"][
-                                group_order
-                            ]
+                            if self._param_to_main_param is None:
+                                self._build_main_param_and_optimizer_state_maps()
                             if key == "param":
-                                tensor_to_copy_into = main_param
+                                tensor_to_copy_into = self._param_to_main_param[model_param]
                             else:
-                                optim_state = self.optimizer.state[main_param]
-                                tensor_to_copy_into = optim_state[key]
+                                tensor_to_copy_into = self._param_to_optimizer_state[model_param][
+                                    key
+                                ]
 
                             # Copy states into contiguous shard.
-                            gbuf_local_start = param_range_map["gbuf_local"].start
-                            gbuf_local_end = param_range_map["gbuf_local"].end
-                            tensor_to_copy_into.data.copy_(
-                                recv_tensor[gbuf_local_start:gbuf_local_end]
-                            )
+                            gbuf_local_start = param_range_map.gbuf_local.start
+                            gbuf_local_end = param_range_map.gbuf_local.end
+                            with torch.cuda.stream(load_stream):
+                                tensor_to_copy_into.data.copy_(
+                                    recv_tensor[gbuf_local_start:gbuf_local_end],
+                                    non_blocking=True,
+                                )
+
+        # The pinned staging buffers may be reused by a later load.
+        load_stream.synchronize()
 
-    def load_parameter_state_from_dp_zero(self, state_dict, *, update_legacy_format=False):
+    def load_parameter_state_from_dp_zero(
+        self, state_dict, *, update_legacy_format=False, use_gloo_comm: bool = True
+    ):
         """Load parameter state (i.e., parameter & optimizer tensors) from DP 0 rank,
         using the new checkpoint format with coalesced state across buckets.
 
@@ -1952,6 +2577,12 @@ class DistributedOptimizer(MixedPrecisionOptimizer):
         - For each DP rank, copy param & optimizer shards from contiguous CPU
           buffers. (e.g., one buffer each for main_param, exp_avg, and
           exp_avg_sq).
+
+        With use_gloo_comm=False the scatters run over the NCCL group instead:
+        rank 0 stages each bucket onto the GPU once and the bulk data moves
+        over NVLink/IB rather than gloo's TCP transport, at the cost of one
+        transient device copy of the bucket on rank 0. Gloo remains the
+        default for memory-constrained loads.
         """
 
         # Selectively load from a legacy checkpoint. The legacy format was used
@@ -1960,18 +2591,62 @@ class DistributedOptimizer(MixedPrecisionOptimizer):
             return self.load_parameter_state_from_dp_zero_legacy(state_dict)
 
         # Data parallelism variables.
-        assert self.data_parallel_group_gloo is not None
-        data_parallel_world_size = self.data_parallel_group_gloo.size()
-        data_parallel_rank = self.data_parallel_group_gloo.rank()
-        data_parallel_group_gloo = self.data_parallel_group_gloo
+        if use_gloo_comm:
+            assert self.data_parallel_group_gloo is not None
+            data_parallel_group = self.data_parallel_group_gloo
+        else:
+            data_parallel_group = self.data_parallel_group
+        data_parallel_world_size = data_parallel_group.size()
+        data_parallel_rank = data_parallel_group.rank()
         data_parallel_global_ranks = torch.distributed.get_process_group_ranks(
-            self.data_parallel_group_gloo
+            data_parallel_group
         )
+        current_device = torch.cuda.current_device()
+        local_shard_keys = ("param", "exp_avg", "exp_avg_sq")
 
         if data_parallel_rank == 0:
             # Do nothing if "--fp8-param-gather" is not used.
             self.split_state_dict_if_needed(state_dict)
 
+        def is_small_scatter_bucket(recv_numel):
+            return recv_numel * torch.float32.itemsize < _SMALL_BUCKET_SCATTER_BYTES
+
+        if use_gloo_comm:
+            # Preflight the pinned receive buffers as one slab. Pinning is an
+            # expensive per-allocation syscall, so a single allocation carved
+            # into per-bucket views beats pinning each buffer lazily in the
+            # middle of the scatter loop. The buffers are always fully
+            # overwritten by the scatters, hence torch.empty.
+            recv_sizes = {}
+            for gbuf_idx, gbuf_range_maps in enumerate(self.gbuf_ranges):
+                for gbuf_range_map_for_all_buckets in gbuf_range_maps.values():
+                    small_recv_numel = 0
+                    for bucket_idx in range(len(gbuf_range_map_for_all_buckets)):
+                        gbuf_world_numel = (
+                            self.buffers[gbuf_idx].buckets[bucket_idx].grad_data.numel()
+                        )
+                        recv_numel = len(local_shard_keys) * (
+                            gbuf_world_numel // data_parallel_world_size
+                        )
+                        if is_small_scatter_bucket(recv_numel):
+                            small_recv_numel += recv_numel
+                        else:
+                            recv_sizes[(gbuf_idx, bucket_idx)] = recv_numel
+                    if small_recv_numel > 0:
+                        recv_sizes[(gbuf_idx, "small_buckets")] = small_recv_numel
+            if any(
+                self._pinned_recv_cache.get(cache_key) is None
+                or self._pinned_recv_cache[cache_key].numel() != numel
+                for cache_key, numel in recv_sizes.items()
+            ):
+                recv_slab = torch.empty(
+                    (sum(recv_sizes.values()),), dtype=torch.float32, pin_memory=True
+                )
+                offset = 0
+                for cache_key, numel in recv_sizes.items():
+                    self._pinned_recv_cache[cache_key] = recv_slab.narrow(0, offset, numel)
+                    offset += numel
+
         # Scatter tensors to all DP ranks.
         for gbuf_idx, gbuf_range_maps in enumerate(self.gbuf_ranges):
             for dtype, gbuf_range_map_for_all_buckets in gbuf_range_maps.items():
@@ -1983,68 +2658,200 @@ class DistributedOptimizer(MixedPrecisionOptimizer):
                         f"({buffer_numel_unpadded}) and checkpoint ({checkpoint_numel_unpadded})"
                     )
                 recv_tensors = {}
-                for key in ("param", "exp_avg", "exp_avg_sq"):
-                    offset_in_world_tensors = 0
-                    for bucket_idx, gbuf_range_map in enumerate(gbuf_range_map_for_all_buckets):
-                        # Compute local DP contiguous shard's size.
-                        gbuf_world_numel = (
-                            self.buffers[gbuf_idx].buckets[bucket_idx].grad_data.numel()
-                        )
-                        assert gbuf_world_numel % data_parallel_world_size == 0
-                        gbuf_local_numel = gbuf_world_numel // data_parallel_world_size
-                        gbuf_world_numel_unpadded = (
-                            self.buffers[gbuf_idx].buckets[bucket_idx].numel_unpadded
+
+                # Metadata pass: classify buckets so that tiny ones share a
+                # single aggregated scatter (their cost is dominated by the
+                # per-collective latency) while large ones keep one scatter
+                # each.
+                bucket_infos = []
+                offset_in_world_tensors = 0
+                for bucket_idx, gbuf_range_map in enumerate(gbuf_range_map_for_all_buckets):
+                    # Compute local DP contiguous shard's size.
+                    bucket = self.buffers[gbuf_idx].buckets[bucket_idx]
+                    gbuf_world_numel = bucket.grad_data.numel()
+                    assert gbuf_world_numel % data_parallel_world_size == 0
+                    gbuf_local_numel = gbuf_world_numel // data_parallel_world_size
+                    gbuf_world_numel_unpadded = bucket.numel_unpadded
+                    assert gbuf_world_numel_unpadded <= gbuf_world_numel
+                    bucket_infos.append(
+                        (
+                            bucket_idx,
+                            gbuf_range_map,
+                            gbuf_world_numel,
+                            gbuf_local_numel,
+                            gbuf_world_numel_unpadded,
+                            offset_in_world_tensors,
                         )
-                        assert gbuf_world_numel_unpadded <= gbuf_world_numel
+                    )
+                    offset_in_world_tensors += gbuf_world_numel_unpadded
+                small_bucket_infos = [
+                    info
+                    for info in bucket_infos
+                    if is_small_scatter_bucket(len(local_shard_keys) * info[3])
+                ]
+                large_bucket_infos = [
+                    info
+                    for info in bucket_infos
+                    if not is_small_scatter_bucket(len(local_shard_keys) * info[3])
+                ]
 
-                        # Contiguous local shards (received from DP rank 0).
-                        recv_tensor = torch.zeros(
-                            (gbuf_local_numel,), dtype=torch.float32, device="cpu"
+                def build_stacked_world_tensor(
+                    gbuf_world_numel, gbuf_local_numel, gbuf_world_numel_unpadded, start
+                ):
+                    """Rank 0: pad and stack the per-key world tensors as
+                    [world, keys, local], so each rank's chunk is one
+                    contiguous send tensor covering all keys."""
+                    end = start + gbuf_world_numel_unpadded
+                    world_tensor_rows = []
+                    for key in local_shard_keys:
+                        world_tensors = state_dict[gbuf_idx][dtype][key]
+                        assert 0 <= start < end <= world_tensors.numel()
+                        world_tensor = world_tensors[start:end]
+
+                        # Pad world_tensor to gbuf_world_numel. Don't pad at the front,
+                        # pad at the back. The copy into the fp32 staging
+                        # buffer also casts checkpoints that store exp_avg
+                        # in a reduced precision (ckpt_exp_avg_dtype). The
+                        # buffer is keyed per state key since all three
+                        # rows must stay live until the stack below.
+                        padded = self._get_pad_buffer((gbuf_world_numel, key), gbuf_world_numel)
+                        padded[:gbuf_world_numel_unpadded].copy_(world_tensor)
+                        if gbuf_world_numel_unpadded < gbuf_world_numel:
+                            padded[gbuf_world_numel_unpadded:].zero_()
+                        world_tensor_rows.append(
+                            padded.view(data_parallel_world_size, gbuf_local_numel)
                         )
+                    return torch.stack(world_tensor_rows, dim=1)
 
-                        # Scatter tensor list.
-                        if data_parallel_rank == 0:
-                            world_tensors = state_dict[gbuf_idx][dtype][key]
+                def register_recv_views(gbuf_range_map, recv_buffer):
+                    """Record each param's per-key views of the received
+                    shard; the actual state copies run grouped below."""
+                    for model_param, param_range_map in gbuf_range_map["param_map"].items():
+                        gbuf_local_start = param_range_map.gbuf_local.start
+                        gbuf_local_end = param_range_map.gbuf_local.end
+                        if model_param not in recv_tensors:
+                            recv_tensors[model_param] = {}
+                        for key_idx, key in enumerate(local_shard_keys):
+                            recv_tensors[model_param][key] = recv_buffer[
+                                key_idx, gbuf_local_start:gbuf_local_end
+                            ]
 
-                            start = offset_in_world_tensors
-                            end = offset_in_world_tensors + gbuf_world_numel_unpadded
-                            assert 0 <= start < end <= world_tensors.numel()
-                            world_tensor = world_tensors[start:end]
-                            offset_in_world_tensors += gbuf_world_numel_unpadded
+                # Large buckets: one stacked scatter per bucket. All three
+                # state keys ride together, so the per-collective latency is
+                # paid once per bucket instead of once per (key, bucket).
+                # Each bucket keeps its own buffer since the views collected
+                # above stay live until the final state copy.
+                for (
+                    bucket_idx,
+                    gbuf_range_map,
+                    gbuf_world_numel,
+                    gbuf_local_numel,
+                    gbuf_world_numel_unpadded,
+                    start,
+                ) in large_bucket_infos:
+                    if use_gloo_comm:
+                        recv_buffer = self._get_pinned_recv_tensor(
+                            (gbuf_idx, bucket_idx), len(local_shard_keys) * gbuf_local_numel
+                        ).view(len(local_shard_keys), gbuf_local_numel)
+                    else:
+                        recv_buffer = torch.empty(
+                            (len(local_shard_keys), gbuf_local_numel),
+                            dtype=torch.float32,
+                            device=current_device,
+                        )
 
-                            # Pad world_tensor to gbuf_world_numel. Don't pad at the front,
-                            # pad at the back.
-                            world_tensor = torch.nn.functional.pad(
-                                world_tensor, (0, gbuf_world_numel - gbuf_world_numel_unpadded)
-                            )
-                            assert world_tensor.numel() == gbuf_world_numel
-                            gbuf_start_idxs = list(range(0, gbuf_world_numel, gbuf_local_numel))
-                            send_tensors = [
-                                world_tensor[i : (i + gbuf_local_numel)] for i in gbuf_start_idxs
-                            ]
-                        else:
-                            send_tensors = None
+                    if data_parallel_rank == 0:
+                        stacked_world_tensor = build_stacked_world_tensor(
+                            gbuf_world_numel, gbuf_local_numel, gbuf_world_numel_unpadded, start
+                        )
+                        if not use_gloo_comm:
+                            # Stage the bucket onto the GPU so the scatter
+                            # runs over the fast fabric.
+                            stacked_world_tensor = stacked_world_tensor.to(current_device)
+                        send_tensors = list(stacked_world_tensor.unbind(0))
+                    else:
+                        send_tensors = None
+
+                    # Scatter.
+                    torch.distributed.scatter(
+                        recv_buffer,
+                        send_tensors,
+                        data_parallel_global_ranks[0],
+                        data_parallel_group,
+                    )
+                    register_recv_views(gbuf_range_map, recv_buffer)
 
-                        # Scatter.
-                        torch.distributed.scatter(
-                            recv_tensor,
-                            send_tensors,
-                            data_parallel_global_ranks[0],
-                            data_parallel_group_gloo,
+                # Small buckets: a single aggregated scatter for all of them.
+                if small_bucket_infos:
+                    agg_recv_numel = sum(
+                        len(local_shard_keys) * info[3] for info in small_bucket_infos
+                    )
+                    if use_gloo_comm:
+                        agg_recv_buffer = self._get_pinned_recv_tensor(
+                            (gbuf_idx, "small_buckets"), agg_recv_numel
+                        )
+                    else:
+                        agg_recv_buffer = torch.empty(
+                            (agg_recv_numel,), dtype=torch.float32, device=current_device
                         )
 
-                        for model_param, param_range_map in gbuf_range_map["param_map"].items():
-                            # Copy states into contiguous shard.
-                            gbuf_local_start = param_range_map["gbuf_local"].start
-                            gbuf_local_end = param_range_map["gbuf_local"].end
-                            if model_param not in recv_tensors:
-                                recv_tensors[model_param] = {}
-                            recv_tensors[model_param][key] = recv_tensor[
-                                gbuf_local_start:gbuf_local_end
-                            ]
+                    if data_parallel_rank == 0:
+                        # [world, sum(keys * local)]: each rank's chunks from
+                        # every small bucket, concatenated.
+                        agg_send_tensor = torch.cat(
+                            [
+                                build_stacked_world_tensor(
+                                    info[2], info[3], info[4], info[5]
+                                ).reshape(data_parallel_world_size, -1)
+                                for info in small_bucket_infos
+                            ],
+                            dim=1,
+                        )
+                        if not use_gloo_comm:
+                            agg_send_tensor = agg_send_tensor.to(current_device)
+                        send_tensors = list(agg_send_tensor.unbind(0))
+                    else:
+                        send_tensors = None
+
+                    torch.distributed.scatter(
+                        agg_recv_buffer,
+                        send_tensors,
+                        data_parallel_global_ranks[0],
+                        data_parallel_group,
+                    )
+
+                    offset = 0
+                    for _, gbuf_range_map, _, gbuf_local_numel, _, _ in small_bucket_infos:
+                        recv_numel = len(local_shard_keys) * gbuf_local_numel
+                        recv_buffer = agg_recv_buffer.narrow(0, offset, recv_numel).view(
+                            len(local_shard_keys), gbuf_local_numel
+                        )
+                        offset += recv_numel
+                        register_recv_views(gbuf_range_map, recv_buffer)
 
-                for model_param, tensors in recv_tensors.items():
-                    self._set_main_param_and_optimizer_states(model_param, tensors)
+                if self.config.use_precision_aware_optimizer_no_fp8_or_ds_fp8:
+                    for model_param, tensors in recv_tensors.items():
+                        self._set_main_param_and_optimizer_states(model_param, tensors)
+                else:
+                    # Group the copies (H2D from pinned buffers for gloo,
+                    # device-local for NCCL) and run them stream-ordered.
+                    dst_tensors_flat = []
+                    src_tensors_flat = []
+                    for model_param, tensors in recv_tensors.items():
+                        dst_tensors = self._get_main_param_and_optimizer_states(model_param)
+                        for key, dst_tensor in dst_tensors.items():
+                            dst_tensors_flat.append(dst_tensor)
+                            src_tensors_flat.append(tensors[key])
+                    if len(dst_tensors_flat) > 0:
+                        load_stream = torch.cuda.Stream()
+                        load_stream.wait_stream(torch.cuda.current_stream())
+                        with torch.cuda.stream(load_stream):
+                            torch._foreach_copy_(
+                                dst_tensors_flat, src_tensors_flat, non_blocking=True
+                            )
+                        # The pinned staging buffers may be reused by a later
+                        # load.
+                        load_stream.synchronize()
 
     @torch.no_grad()
     def load_parameter_state_from_fully_reshardable(self, state_dict: dict):
@@ -2083,12 +2890,12 @@ class DistributedOptimizer(MixedPrecisionOptimizer):
                             continue
                         v_flat = v.flatten()
                         v_flat = v_flat[
-                            param_range_map["param"].start : param_range_map["param"].end
+                            param_range_map.param.start : param_range_map.param.end
                         ]
                         assert (
                             len(v_flat)
-                            == param_range_map["param"].end - param_range_map["param"].start
-                        ), (len(v_flat), param_range_map["param"])
+                            == param_range_map.param.end - param_range_map.param.start
+                        ), (len(v_flat), param_range_map.param)
                         if k == "fp32_param":
                             src_tensors["param"] = v_flat
                         else:
@@ -2097,6 +2904,23 @@ class DistributedOptimizer(MixedPrecisionOptimizer):
         if isinstance(self.optimizer, HybridDeviceOptimizer):
             self.optimizer._sync_hdo_state_to_sub_optimizers()
 
+    @staticmethod
+    def _split_segments_by_flag(tensor, numels, flags):
+        """Split a coalesced buffer into its flagged and unflagged halves.
+
+        ``tensor`` holds per-param segments of sizes ``numels`` laid out
+        back-to-back; ``flags[i]`` says which output the i-th segment belongs
+        to. Built from per-segment views and one cat per side, so the
+        transient cost is O(#params) metadata rather than per-element index
+        tensors.
+        """
+        segments = torch.split(tensor, numels)
+        flagged = [seg for seg, flag in zip(segments, flags) if flag]
+        unflagged = [seg for seg, flag in zip(segments, flags) if not flag]
+        flagged_out = torch.cat(flagged) if flagged else tensor.new_empty(0)
+        unflagged_out = torch.cat(unflagged) if unflagged else tensor.new_empty(0)
+        return flagged_out, unflagged_out
+
     def split_state_dict_if_needed(self, state_dict):
         """
         When "--fp8-param-gather" is disabled, weights and biases are stored in the same
@@ -2176,49 +3000,33 @@ class DistributedOptimizer(MixedPrecisionOptimizer):
             fp8_buffer = self.buffers[fp8_gbuf_idx]
             non_fp8_buffer = self.buffers[non_fp8_gbuf_idx]
 
-            fp8_idx = len(fp8_buffer.params) - 1
-            non_fp8_idx = len(non_fp8_buffer.params) - 1
-            offsets, fp8_offsets, non_fp8_offsets = [0], [0], [0]
-
             # Because the parameters in `_ParamAndGradBuffer` are traversed in reverse order, the
-            # flag here also needs to be traversed in reverse order.
-            for fp8_flag in fp8_flags[::-1]:
-                if fp8_flag:
-                    numel = fp8_buffer.params[fp8_idx].nelement()
-                    fp8_idx -= 1
-                    offsets.append(offsets[-1] + numel)
-                    fp8_offsets.append(fp8_offsets[-1] + numel)
-                else:
-                    numel = non_fp8_buffer.params[non_fp8_idx].nelement()
-                    non_fp8_idx -= 1
-                    offsets.append(offsets[-1] + numel)
-                    non_fp8_offsets.append(non_fp8_offsets[-1] + numel)
-
-            # Split the target buffer into two separate buffers.
+            # flags and per-param numels are also taken in reverse order. The offset arithmetic
+            # runs as NumPy vector ops rather than a Python accumulation loop; everything here is
+            # O(#params) — nothing is expanded to per-element size.
+            is_fp8 = np.array(fp8_flags[::-1], dtype=bool)
+            numels = np.empty(len(fp8_flags), dtype=np.int64)
+            numels[is_fp8] = [p.nelement() for p in reversed(fp8_buffer.params)]
+            numels[~is_fp8] = [p.nelement() for p in reversed(non_fp8_buffer.params)]
+            fp8_numel_unpadded = int(numels[is_fp8].sum())
+            non_fp8_numel_unpadded = int(numels[~is_fp8].sum())
+
+            # Split the target buffer into two separate buffers, per-segment
+            # views plus one cat per side: O(#params) metadata, no per-element
+            # index tensors on the checkpoint-load path.
             fp8_state_dict, non_fp8_state_dict = {}, {}
+            split_sizes = numels.tolist()
+            flags = is_fp8.tolist()
             for key in ['param', 'exp_avg', 'exp_avg_sq']:
                 tensor = state_dict[non_fp8_gbuf_idx][non_fp8_param_and_grad_dtype][key]
-                fp8_tensor = torch.empty([fp8_offsets[-1]], dtype=tensor.dtype)
-                non_fp8_tensor = torch.empty([non_fp8_offsets[-1]], dtype=tensor.dtype)
-
-                fp8_idx, non_fp8_idx = 0, 0
-                for i in range(len(offsets) - 1):
-                    if fp8_flags[-(i + 1)]:
-                        fp8_tensor[fp8_offsets[fp8_idx] : fp8_offsets[fp8_idx + 1]].copy_(
-                            tensor[offsets[i] : offsets[i + 1]]
-                        )
-                        fp8_idx += 1
-                    else:
-                        non_fp8_tensor[
-                            non_fp8_offsets[non_fp8_idx] : non_fp8_offsets[non_fp8_idx + 1]
-                        ].copy_(tensor[offsets[i] : offsets[i + 1]])
-                        non_fp8_idx += 1
-
-                fp8_state_dict[key] = fp8_tensor
-                non_fp8_state_dict[key] = non_fp8_tensor
+                fp8_state_dict[key], non_fp8_state_dict[key] = self._split_segments_by_flag(
+                    tensor, split_sizes, flags
+                )
+            assert fp8_state_dict['param'].numel() == fp8_numel_unpadded
+            assert non_fp8_state_dict['param'].numel() == non_fp8_numel_unpadded
 
-            fp8_state_dict['numel_unpadded'] = fp8_offsets[-1]
-            non_fp8_state_dict['numel_unpadded'] = non_fp8_offsets[-1]
+            fp8_state_dict['numel_unpadded'] = fp8_numel_unpadded
+            non_fp8_state_dict['numel_unpadded'] = non_fp8_numel_unpadded
 
             # Add the two separate buffers into `new_state_dict`.
             new_state_dict[fp8_gbuf_idx] = {}
@@ -2240,10 +3048,23 @@ class DistributedOptimizer(MixedPrecisionOptimizer):
             return
         state_dict = None
         if self.data_parallel_group.rank() == 0:
-            state_dict = torch.load(filename)
-
+            # Prime kernel readahead for the sequential bucket slicing below,
+            # so paging overlaps with the scatters.
+            try:
+                with open(filename, "rb") as f:
+                    os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_WILLNEED)
+            except (AttributeError, OSError):
+                pass
+            # mmap defers paging instead of reading the whole checkpoint into
+            # RAM up front; the scatter loop then touches only the bytes it
+            # stages, keeping rank-0 peak memory at ~one bucket.
+            state_dict = torch.load(filename, mmap=True)
+
+        # Mirror save_parameter_state(): the bulk scatter runs over NCCL with
+        # GPU staging; gloo remains available via use_gloo_comm=True for
+        # memory-constrained loads.
         self.load_parameter_state_from_dp_zero(
-            state_dict, update_legacy_format=update_legacy_format
+            state_dict, update_legacy_format=update_legacy_format, use_gloo_comm=False
         )
 
     def zero_grad(self, set_to_none: bool = True):
@@ -2288,6 +3109,11 @@ class DistributedOptimizer(MixedPrecisionOptimizer):
                 for group in self.optimizer.param_groups
                 for param in group["params"]
             ]
+        elif self._main_grad_unscale_views is not None:
+            # The float16 shard grads all view one flat slab (see
+            # _copy_model_grads_to_main_grads), so the unscale pass runs over
+            # a few large tensors instead of one entry per parameter.
+            return list(self._main_grad_unscale_views)
         else:
             return [
                 param.grad.data
@@ -2316,7 +3142,13 @@ class DistributedOptimizer(MixedPrecisionOptimizer):
         """
         Get lists of FP8 model params, corresponding shard main params, and the starting index of
         the shard main param in the FP8 param. Parameters in all three lists are in the same order.
+
+        The buffer/group membership is fixed after init, so the scan over every parameter only
+        runs once; subsequent calls return the cached lists.
         """
+        if self._fp8_param_shard_cache is not None:
+            return self._fp8_param_shard_cache
+
         fp8_params = []
         shard_fp32_from_fp8 = []
         shard_offsets_in_fp8 = []
@@ -2352,7 +3184,7 @@ class DistributedOptimizer(MixedPrecisionOptimizer):
                 for shard_main_param, model_param in zip(shard_main_group, model_group):
                     if is_float8tensor(model_param):
                         param_range_map = self._get_model_param_range_map(model_param)
-                        param_range = param_range_map["param"]
+                        param_range = param_range_map.param
                         assert param_range.size == shard_main_param.nelement()
                         idx = fp8_param_to_idx_map[model_param]
                         shard_fp32_from_fp8[idx] = shard_main_param
@@ -2361,7 +3193,8 @@ class DistributedOptimizer(MixedPrecisionOptimizer):
         get_shard_fp32_from_fp8(self.shard_fp32_from_float16_groups, self.model_float16_groups)
         get_shard_fp32_from_fp8(self.shard_fp32_groups, self.model_fp32_groups)
 
-        return fp8_params, shard_fp32_from_fp8, shard_offsets_in_fp8
+        self._fp8_param_shard_cache = (fp8_params, shard_fp32_from_fp8, shard_offsets_in_fp8)
+        return self._fp8_param_shard_cache
 
     def _copy_model_grads_to_main_grads(self):
         """
@@ -2377,34 +3210,96 @@ class DistributedOptimizer(MixedPrecisionOptimizer):
         if self.ddp_config.use_megatron_fsdp:
             return
 
-        # Utility method for copying group grads.
-        def copy_group_grads(model_groups, shard_main_groups):
-            for model_group, shard_main_group in zip(model_groups, shard_main_groups):
-                for model_param, shard_main_param in zip(model_group, shard_main_group):
+        if self._grad_copy_plan is None:
+            # The range-map lookups and grad-buffer views below are the same
+            # every step; resolve them once and cache the resulting
+            # assignments and batched-cast lists.
+            grad_assignments = []
+            cast_requests = []
+            fp32_alias_grads = []
 
-                    param_range_map = self._get_model_param_range_map(model_param)
-                    param_range = param_range_map["param"]
-                    assert param_range.size == shard_main_param.nelement()
+            # Utility method for building the copy plan of group grads.
+            def copy_group_grads(model_groups, shard_main_groups):
+                for model_group, shard_main_group in zip(model_groups, shard_main_groups):
+                    for model_param, shard_main_param in zip(model_group, shard_main_group):
 
-                    model_grad = model_param.main_grad
-                    shard_model_grad = model_grad.view(-1)[param_range.start : param_range.end]
-                    if self.config.use_precision_aware_optimizer_no_fp8_or_ds_fp8:
-                        # Pytorch requires a param and its' grad to be the same dtype, but we want
-                        # their types to be different in precision-aware optimizer. So we use
-                        # ".decoupled_grad" to replace ".grad".
-                        # Note that this requires corresponding modifications in the optimizer (Let
-                        # the optimizer read gradients from ".decoupled_grad" instead of ".grad").
-                        shard_main_param.decoupled_grad = shard_model_grad
-                    else:
-                        shard_main_param.grad = shard_model_grad.float()
+                        param_range_map = self._get_model_param_range_map(model_param)
+                        param_range = param_range_map.param
+                        assert param_range.size == shard_main_param.nelement()
 
-        # Copy model groups to shard groups.
+                        model_grad = model_param.main_grad
+                        shard_model_grad = model_grad.view(-1)[param_range.start : param_range.end]
+                        if self.config.use_precision_aware_optimizer_no_fp8_or_ds_fp8:
+                            # Pytorch requires a param and its' grad to be the same dtype, but we
+                            # want their types to be different in precision-aware optimizer. So we
+                            # use ".decoupled_grad" to replace ".grad".
+                            # Note that this requires corresponding modifications in the optimizer
+                            # (Let the optimizer read gradients from ".decoupled_grad" instead of
+                            # ".grad").
+                            grad_assignments.append((shard_main_param, shard_model_grad))
+                        elif shard_model_grad.dtype == torch.float32:
+                            # Already fp32: alias the grad-buffer shard directly
+                            # (no allocation, as .float() behaved here).
+                            grad_assignments.append((shard_main_param, shard_model_grad))
+                            fp32_alias_grads.append(shard_model_grad)
+                        else:
+                            cast_requests.append((shard_main_param, shard_model_grad))
+
+            if self.config.use_precision_aware_optimizer_no_fp8_or_ds_fp8:
+                copy_group_grads(self.model_float16_groups, self.shard_float16_groups)
+                copy_group_grads(self.model_fp32_groups, self.shard_fp32_groups)
+            else:
+                copy_group_grads(self.model_float16_groups, self.shard_fp32_from_float16_groups)
+                copy_group_grads(self.model_fp32_groups, self.shard_fp32_groups)
+
+            # Cast into persistent fp32 buffers instead of allocating new
+            # tensors via .float() every step. The buffers are carved out of
+            # one flat slab so downstream passes over all main grads (e.g. the
+            # unscale / non-finite check) see a single contiguous tensor
+            # rather than one tensorlist entry per parameter.
+            cast_grad_dsts = []
+            cast_grad_srcs = []
+            flat_main_grad = None
+            if cast_requests:
+                total_numel = sum(p.nelement() for p, _ in cast_requests)
+                flat_main_grad = torch.empty(
+                    (total_numel,), dtype=torch.float32, device=cast_requests[0][0].device
+                )
+                offset = 0
+                for shard_main_param, shard_model_grad in cast_requests:
+                    numel = shard_main_param.nelement()
+                    main_grad = flat_main_grad.narrow(0, offset, numel).view_as(shard_main_param)
+                    offset += numel
+                    self._shard_main_grad_buffers[shard_main_param] = main_grad
+                    cast_grad_dsts.append(main_grad)
+                    cast_grad_srcs.append(shard_model_grad)
+                    grad_assignments.append((shard_main_param, main_grad))
+
+            # Adjacent shard ranges merge into spanning views, so the grouped
+            # copy below runs one kernel per contiguous run per bucket instead
+            # of one tensorlist entry per parameter.
+            cast_grad_dsts, cast_grad_srcs = self._coalesce_copy_plan(
+                cast_grad_dsts, cast_grad_srcs
+            )
+
+            self._grad_copy_plan = (grad_assignments, cast_grad_dsts, cast_grad_srcs)
+            if not self.config.use_precision_aware_optimizer_no_fp8_or_ds_fp8:
+                self._main_grad_unscale_views = (
+                    [] if flat_main_grad is None else [flat_main_grad]
+                ) + fp32_alias_grads
+
+        # Replay the cached plan: re-attach the grads (zero_grad() may have
+        # set them to None) and launch the casting copies as one grouped
+        # kernel instead of one kernel per parameter.
+        grad_assignments, cast_grad_dsts, cast_grad_srcs = self._grad_copy_plan
         if self.config.use_precision_aware_optimizer_no_fp8_or_ds_fp8:
-            copy_group_grads(self.model_float16_groups, self.shard_float16_groups)
-            copy_group_grads(self.model_fp32_groups, self.shard_fp32_groups)
+            for shard_main_param, shard_grad in grad_assignments:
+                shard_main_param.decoupled_grad = shard_grad
         else:
-            copy_group_grads(self.model_float16_groups, self.shard_fp32_from_float16_groups)
-            copy_group_grads(self.model_fp32_groups, self.shard_fp32_groups)
+            for shard_main_param, shard_grad in grad_assignments:
+                shard_main_param.grad = shard_grad
+        if cast_grad_dsts:
+            torch._foreach_copy_(cast_grad_dsts, cast_grad_srcs)
 
     def _copy_main_params_to_model_params(self):
         """
@@ -2427,36 +3322,67 @@ class DistributedOptimizer(MixedPrecisionOptimizer):
         if self.config.use_precision_aware_optimizer_no_fp8_or_ds_fp8:
             return
 
-        quantize_param_shard(
-            *self._get_fp8_params_and_shard_fp32_from_fp8(), self.data_parallel_group
-        )
+        # Launch the packed amax all-reduce asynchronously; it has no data
+        # dependency on the param all-gather that follows the optimizer step,
+        # so step_with_ready_grads() waits on it only after the all-gathers
+        # are in flight. (It cannot be coalesced with the grad reduce-scatter
+        # instead: that completes during backward, before the optimizer step
+        # that produces these amaxes.) The cached fp8 param lists double as a
+        # fast-path flag: pure bf16/fp16 models skip the call entirely every
+        # step.
+        fp8_params_and_shards = self._get_fp8_params_and_shard_fp32_from_fp8()
+        if fp8_params_and_shards[0]:
+            self._fp8_amax_reduce_handle = quantize_param_shard(
+                *fp8_params_and_shards, self.data_parallel_group, async_op=True
+            )
 
-        # Utility method for copying group params.
-        def copy_group_params(shard_main_groups, model_groups):
-            for shard_main_group, model_group in zip(shard_main_groups, model_groups):
-                for shard_main_param, model_param in zip(shard_main_group, model_group):
+        if self._param_copy_plan is None:
+            copy_dsts = []
+            copy_srcs = []
 
-                    param_range_map = self._get_model_param_range_map(model_param)
-                    world_range = param_range_map["gbuf_world_in_bucket"]
+            # Utility method for building the copy plan of group params.
+            def copy_group_params(shard_main_groups, model_groups):
+                for shard_main_group, model_group in zip(shard_main_groups, model_groups):
+                    for shard_main_param, model_param in zip(shard_main_group, model_group):
 
-                    assert world_range.size == shard_main_param.nelement()
+                        param_range_map = self._get_model_param_range_map(model_param)
+                        world_range = param_range_map.gbuf_world_in_bucket
 
-                    gbuf_index, _, bucket_id = self.model_param_gbuf_map[model_param]
-                    model_param_buffer = self.buffers[gbuf_index].buckets[bucket_id].param_data
+                        assert world_range.size == shard_main_param.nelement()
 
-                    shard_model_param = model_param_buffer.view(-1)[
-                        world_range.start : world_range.end
-                    ]
+                        gbuf_index, _, bucket_id = self.model_param_gbuf_map[model_param]
+                        model_param_buffer = self.buffers[gbuf_index].buckets[bucket_id].param_data
 
-                    if is_float8tensor(model_param):
-                        # FP8 params are quantized in the above "quantize_param_shard" function.
-                        continue
-                    else:
-                        shard_model_param.data.copy_(shard_main_param)
+                        shard_model_param = model_param_buffer.view(-1)[
+                            world_range.start : world_range.end
+                        ]
+
+                        if is_float8tensor(model_param):
+                            # FP8 params are quantized in the above "quantize_param_shard"
+                            # function.
+                            continue
+                        elif (
+                            shard_model_param.data_ptr() == shard_main_param.data_ptr()
+                            and shard_model_param.numel() == shard_main_param.numel()
+                        ):
+                            # fp32 shard main params can alias the param buffer
+                            # slice directly; copying a tensor onto itself is a
+                            # no-op, so leave such pairs out of the plan.
+                            continue
+                        else:
+                            copy_dsts.append(shard_model_param.data)
+                            copy_srcs.append(shard_main_param)
+
+            copy_group_params(self.shard_fp32_from_float16_groups, self.model_float16_groups)
+            copy_group_params(self.shard_fp32_groups, self.model_fp32_groups)
+
+            self._param_copy_plan = (copy_dsts, copy_srcs)
 
-        # Copy shard groups to model groups.
-        copy_group_params(self.shard_fp32_from_float16_groups, self.model_float16_groups)
-        copy_group_params(self.shard_fp32_groups, self.model_fp32_groups)
+        # Launch all copies (with their dtype casts) as one grouped kernel
+        # instead of one kernel per parameter.
+        copy_dsts, copy_srcs = self._param_copy_plan
+        if copy_dsts:
+            torch._foreach_copy_(copy_dsts, copy_srcs)
 
     def _copy_main_params_to_param_buffer(self):
         """
@@ -2465,22 +3391,32 @@ class DistributedOptimizer(MixedPrecisionOptimizer):
         param buffer is not mapped to model params for MXFP8 case.
 
         """
-        for shard_main_group, model_group in zip(
-            self.shard_fp32_from_float16_groups, self.model_float16_groups
-        ):
-            for shard_main_param, model_param in zip(shard_main_group, model_group):
-                # Get position in param buffer
-                param_range_map = self._get_model_param_range_map(model_param)
-                world_range = param_range_map["gbuf_world_in_bucket"]
+        if self._param_buffer_copy_plan is None:
+            copy_dsts = []
+            copy_srcs = []
+            for shard_main_group, model_group in zip(
+                self.shard_fp32_from_float16_groups, self.model_float16_groups
+            ):
+                for shard_main_param, model_param in zip(shard_main_group, model_group):
+                    # Get position in param buffer
+                    param_range_map = self._get_model_param_range_map(model_param)
+                    world_range = param_range_map.gbuf_world_in_bucket
+
+                    # Get param buffer
+                    gbuf_index, _, bucket_id = self.model_param_gbuf_map[model_param]
+                    param_buffer = self.buffers[gbuf_index].buckets[bucket_id].param_data
 
-                # Get param buffer
-                gbuf_index, _, bucket_id = self.model_param_gbuf_map[model_param]
-                param_buffer = self.buffers[gbuf_index].buckets[bucket_id].param_data
+                    # Get the correct slice of param buffer
+                    shard_param_buffer = param_buffer.view(-1)[world_range.start : world_range.end]
 
-                # Get the correct slice of param buffer
-                shard_param_buffer = param_buffer.view(-1)[world_range.start : world_range.end]
+                    copy_dsts.append(shard_param_buffer)
+                    copy_srcs.append(shard_main_param)
 
-                shard_param_buffer.copy_(shard_main_param)
+            self._param_buffer_copy_plan = (copy_dsts, copy_srcs)
+
+        copy_dsts, copy_srcs = self._param_buffer_copy_plan
+        if copy_dsts:
+            torch._foreach_copy_(copy_dsts, copy_srcs)
 
     def _build_model_param_to_state_dict_param_map(self, state_dict):
         """Create a map from model params to tensors in state_dict based on their names."""
@@ -2547,13 +3483,16 @@ class DistributedOptimizer(MixedPrecisionOptimizer):
                 state_dict
             )
 
+        copy_dsts = []
+        copy_srcs = []
+
         # Utility method for copying group params.
         def copy_group_params(model_groups, shard_main_groups):
             for model_group, shard_main_group in zip(model_groups, shard_main_groups):
                 for model_param, shard_main_param in zip(model_group, shard_main_group):
 
                     param_range_map = self._get_model_param_range_map(model_param)
-                    param_range = param_range_map["param"]
+                    param_range = param_range_map.param
                     assert param_range.size == shard_main_param.nelement()
 
                     if state_dict is not None:
@@ -2568,12 +3507,16 @@ class DistributedOptimizer(MixedPrecisionOptimizer):
                         shard_model_param = model_param.view(-1)[
                             param_range.start : param_range.end
                         ]
-                    shard_main_param.data.copy_(shard_model_param)
+                    copy_dsts.append(shard_main_param.data)
+                    copy_srcs.append(shard_model_param)
 
         # Copy model groups to shard groups.
         copy_group_params(self.model_float16_groups, self.shard_fp32_from_float16_groups)
         copy_group_params(self.model_fp32_groups, self.shard_fp32_groups)
 
+        if copy_dsts:
+            torch._foreach_copy_(copy_dsts, copy_srcs)
+
     @torch.no_grad()
     def step_with_ready_grads(self) -> bool:
         """Step the optimizer with ready gradients, return successful.
@@ -2582,9 +3525,12 @@ class DistributedOptimizer(MixedPrecisionOptimizer):
         """
         update_successful = super().step_with_ready_grads()
 
-        timers = self.config.timers
-        if timers is not None:
-            timers('params-all-gather', log_level=1).start(barrier=self.config.barrier_with_L1_time)
+        timer = self._params_all_gather_timer
+        if timer is None and self.config.timers is not None:
+            timer = self.config.timers('params-all-gather', log_level=1)
+            self._params_all_gather_timer = timer
+        if timer is not None:
+            timer.start(barrier=self.config.barrier_with_L1_time)
 
         if self.ddp_config.use_megatron_fsdp:
             for model_chunk in self.model_chunks:
@@ -2594,10 +3540,37 @@ class DistributedOptimizer(MixedPrecisionOptimizer):
             # communication calls here. If overlapping all-gather for parameters, the following
             # the first all-gather is launched asynchronously in the next optimizer.zero_grad()
             # call and subsequent all-gathers are launched in the forward pre-hook.
+            # Each chunk's bucket groups already coalesce their per-bucket
+            # all-gathers into one NCCL group call; packing chunks into a
+            # single all_gather_into_tensor would additionally require one
+            # contiguous param buffer spanning model chunks, which this
+            # per-chunk buffer layout does not provide. The per-chunk calls
+            # below are also CPU-cheap as-is: "synchronous" c10d collectives
+            # still enqueue asynchronously on the GPU, and collectives on one
+            # communicator serialize there by design, so chaining the chunks
+            # through async handles would not change the GPU timeline.
             if not self.ddp_config.overlap_param_gather:
                 for model_chunk in self.model_chunks:
                     model_chunk.start_param_sync()
-        if timers is not None:
-            timers('params-all-gather').stop()
+            else:
+                # Kick off the first bucket group's async all-gather now rather
+                # than from the first forward pre-hook, hiding it behind the
+                # Python-side gap before the next forward pass. The remaining
+                # bucket groups still chain from the forward pre-hooks.
+                for model_chunk in self.model_chunks:
+                    model_chunk.start_first_param_sync()
+        if timer is not None:
+            timer.stop()
+
+        # Finish the async fp8 amax all-reduce (launched while copying main
+        # params to model params) now that the param all-gathers are in
+        # flight; the next forward quantizes with the reduced amaxes. The
+        # reduce cannot join the all-gathers' coalescing scope -- it runs on
+        # the full data-parallel group while the gathers use the
+        # intra-instance group -- but having both in flight hides its latency
+        # just the same.
+        if self._fp8_amax_reduce_handle is not None:
+            self._fp8_amax_reduce_handle.wait()
+            self._fp8_amax_reduce_handle = None
 
         return update_successful
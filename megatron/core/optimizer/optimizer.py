@@ -59,10 +59,13 @@ def _zero_grad_group_helper(
 ):
     """
     Zero out the gradient for a group of parameters.
-    Note: copied from torch.optim.optimizer.
+    Note: copied from torch.optim.optimizer, with the actual zeroing done
+    through a grouped `torch._foreach_zero_` (one kernel launch per
+    device/dtype combination instead of one per gradient).
     """
+    grad_attr = "decoupled_grad" if use_decoupled_grad else "grad"
+    grads_to_zero = {}
     for param in group:
-        grad_attr = "decoupled_grad" if use_decoupled_grad else "grad"
         if hasattr(param, grad_attr) and getattr(param, grad_attr) is not None:
             if set_to_none:
                 setattr(param, grad_attr, None)
@@ -72,19 +75,35 @@ def _zero_grad_group_helper(
                     grad_obj.detach_()
                 else:
                     grad_obj.requires_grad_(False)
-                grad_obj.zero_()
+                grads_to_zero.setdefault((grad_obj.device, grad_obj.dtype), []).append(grad_obj)
+    for grads in grads_to_zero.values():
+        torch._foreach_zero_(grads)
 
 
 def _multi_tensor_copy_this_to_that(
     this: List[torch.Tensor], that: List[torch.Tensor], overflow_buf: Optional[torch.Tensor] = None
 ):
     """
-    Use multi-tensor-applier to copy values from one list to another.
-    We don't have a bfloat16 implementation so for now if the overflow_buf
-    is not provided, we default back to simple loop copy to be compatible
-    with bfloat16.
+    Copy values from one list of tensors to another.
+
+    When source and destination tensors share a device and dtype, use the
+    native grouped copy (`torch._foreach_copy_`), which fuses the copies into
+    a single kernel launch without the Apex/TE multi-tensor-applier
+    indirection. Mixed-dtype copies (e.g., fp32 main params to fp16 model
+    params) still go through multi-tensor scale when an overflow_buf is
+    provided, and fall back to a per-tensor loop otherwise (e.g., for
+    bfloat16, which multi-tensor scale does not support).
     """
-    if overflow_buf is not None:
+    if len(this) == 0:
+        return
+    device_and_dtype = (this[0].device, this[0].dtype)
+    if all(
+        (this_.device, this_.dtype) == device_and_dtype
+        and (that_.device, that_.dtype) == device_and_dtype
+        for this_, that_ in zip(this, that)
+    ):
+        torch._foreach_copy_(that, this)
+    elif overflow_buf is not None:
         overflow_buf.fill_(0)
         # Scaling with factor `1.0` is equivalent to copy.
         multi_tensor_applier(multi_tensor_scale_impl, overflow_buf, [this, that], 1.0)
@@ -1361,6 +1380,12 @@ class ChainedOptimizer(MegatronOptimizer):
         if save_states:
             torch.save(states, filename)
 
+    def finalize_parameter_state_save(self):
+        """Block until any in-flight background parameter-state write completes."""
+        for optimizer in self.chained_optimizers:
+            if hasattr(optimizer, 'finalize_parameter_state_save'):
+                optimizer.finalize_parameter_state_save()
+
     def load_parameter_state(self, filename: str, *, update_legacy_format: bool = False):
         """Load the distributed parameter states of all optimizers from a file.
 
@@ -82,6 +82,11 @@ class OptimizerConfig:
     exp_avg_sq_dtype: torch.dtype = torch.float32
     """dtype of exp_avg_sq when enabling precision-aware-optimizer"""
 
+    ckpt_exp_avg_dtype: torch.dtype = torch.float32
+    """dtype of the gathered exp_avg shards in dp_zero_gather_scatter checkpoints. Setting this
+    to bf16 shrinks the checkpoint and its I/O; the first moment tolerates the reduced
+    precision, while param and exp_avg_sq always stay fp32."""
+
     optimizer: str = 'adam'
     """Optimizer name. NOTE: Deprecated, use individual optimizer classes instead."""
 
@@ -633,6 +633,12 @@ def save_checkpoint(iteration, model, optimizer, opt_param_scheduler, num_floati
     if ckpt_type != CheckpointType.LOCAL:
         if not args.async_save:
             assert async_save_request is None
+            # Drain any background write of the distributed optimizer's
+            # parameter state (see DistributedOptimizer.save_parameter_state)
+            # before the barrier and tracker update, so a crash in this window
+            # cannot leave the tracker pointing at a truncated distrib_opt.pt.
+            if optimizer is not None and hasattr(optimizer, 'finalize_parameter_state_save'):
+                optimizer.finalize_parameter_state_save()
             # Wait so everyone is done (necessary)
             if torch.distributed.is_initialized():
                 torch.distributed.barrier()
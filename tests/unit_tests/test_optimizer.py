@@ -598,3 +598,60 @@ def test_get_megatron_optimizer_custom_process_groups_validation():
             use_gloo_process_groups=True,  # Should be False when using custom groups
             pg_collection=pg_collection_complete,
         )
+
+
+def test_split_segments_by_flag():
+    """CPU test for the coalesced-buffer split used by split_state_dict_if_needed."""
+    from megatron.core.optimizer.distrib_optimizer import DistributedOptimizer
+
+    numels = [3, 1, 4, 2, 5]
+    flags = [True, False, True, False, True]
+    segments = [torch.full((numel,), float(i)) for i, numel in enumerate(numels)]
+    buffer = torch.cat(segments)
+
+    flagged, unflagged = DistributedOptimizer._split_segments_by_flag(buffer, numels, flags)
+    assert torch.equal(flagged, torch.cat([segments[0], segments[2], segments[4]]))
+    assert torch.equal(unflagged, torch.cat([segments[1], segments[3]]))
+
+    # All segments on one side: the other side comes back empty.
+    flagged, unflagged = DistributedOptimizer._split_segments_by_flag(
+        buffer, numels, [True] * len(numels)
+    )
+    assert torch.equal(flagged, buffer)
+    assert unflagged.numel() == 0
+
+
+def test_coalesce_copy_plan():
+    """CPU test for the adjacency merging used by the cached copy plans."""
+    from megatron.core.optimizer.distrib_optimizer import DistributedOptimizer
+
+    src_slab = torch.arange(12, dtype=torch.float32)
+    dst_slab = torch.zeros(12, dtype=torch.float32)
+    srcs = [src_slab[0:4], src_slab[4:9], src_slab[9:12]]
+    dsts = [dst_slab[0:4], dst_slab[4:9], dst_slab[9:12]]
+
+    # Adjacent views of the same storages on both sides merge into one pair.
+    merged_dsts, merged_srcs = DistributedOptimizer._coalesce_copy_plan(dsts, srcs)
+    assert len(merged_dsts) == 1 and len(merged_srcs) == 1
+    assert merged_srcs[0].numel() == 12
+    merged_dsts[0].copy_(merged_srcs[0])
+    assert torch.equal(dst_slab, src_slab)
+
+    # Tensors from different storages must not merge, even when their raw
+    # data pointers happen to be adjacent (here forced via two frombuffer
+    # tensors over one bytearray): as_strided across a storage boundary
+    # would read a neighboring tensor's bytes.
+    raw = bytearray(8 * 4)
+    view = memoryview(raw)
+    adjacent_srcs = [
+        torch.frombuffer(view[:16], dtype=torch.float32),
+        torch.frombuffer(view[16:], dtype=torch.float32),
+    ]
+    assert (
+        adjacent_srcs[0].data_ptr() + adjacent_srcs[0].nelement() * adjacent_srcs[0].element_size()
+        == adjacent_srcs[1].data_ptr()
+    )
+    merged_dsts, merged_srcs = DistributedOptimizer._coalesce_copy_plan(
+        [dst_slab[0:4], dst_slab[4:8]], adjacent_srcs
+    )
+    assert len(merged_dsts) == 2 and len(merged_srcs) == 2